@@ -1 +1,6 @@
-from polygon_math.polygon import polygon
\ No newline at end of file
+from polygon_math.polygon import polygon
+from polygon_math.collection import polygonCollection, mapProperties
+from polygon_math.triangles import triangleCollection
+from polygon_math.quality import meshQuality
+from polygon_math.reader import readPolygons
+from polygon_math.store import polygonStore
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from polygon_math.polygon import polygon, _polygonBase
+from polygon_math.triangulation import _rings
+from polygon_math.sweep import _Tolerance, _boxes, _overlappingPairs, _intersect, _project
+
+# #############################################################################
+# boolean operations of polygons
+# #############################################################################
+
+def boolean(A, B, operation):
+    """
+    boolean operation of polygon objects A and B:
+    'union', 'intersection' or 'difference' (A without B)
+    returns polygon object (rings connected, see polygon.fromRings), None if empty
+    
+    The edges of both polygons are split at their intersections (sweep line),
+    the parts of the edges are selected by their position to the other polygon
+    (inside, outside, shared edges in same or opposite direction) and
+    joined to closed rings. Outer contours are counter-clockwise, holes clockwise.
+    """
+    PA0, PA1 = _edges(A)
+    PB0, PB1 = _edges(B)
+    P0 = np.concatenate((PA0, PB0))
+    P1 = np.concatenate((PA1, PB1))
+    
+    # split edges at intersections of edges of A and B
+    i, j = _overlappingPairs(_boxes(P0, P1))
+    other = (i < len(PA0)) != (j < len(PA0))
+    S, E, edge = _split(P0, P1, i[other], j[other])
+    fromA = edge < len(PA0)
+    
+    # position of parts of edges
+    same, opposite = _shared(S, E, fromA)
+    shared = same | opposite
+    middle = (S + E)/2
+    inside = np.zeros(len(S), dtype=bool)
+    inside[fromA]  = B.isPointInside(middle[fromA])
+    inside[~fromA] = A.isPointInside(middle[~fromA])
+    
+    # selection of parts of edges (shared edges are taken from A)
+    if operation == 'union':
+        keep = ~shared & ~inside | fromA & same
+    elif operation == 'intersection':
+        keep = ~shared & inside | fromA & same
+    elif operation == 'difference':
+        keep = fromA & ~shared & ~inside | ~fromA & ~shared & inside | fromA & opposite
+        reverse = ~fromA & keep
+        S[reverse], E[reverse] = E[reverse], S[reverse].copy()
+    else:
+        raise ValueError(f'unknown boolean operation: {operation}')
+    
+    rings = [_simplify(ring) for ring in _loops(S[keep], E[keep])]
+    rings = [np.vstack(( ring, ring[:1] )) for ring in rings if len(ring) > 2]     # closed
+    areas = [_polygonBase._area(ring) for ring in rings]
+    rings = [ring for area, ring in sorted(zip(areas, rings), key=lambda pair: -abs(pair[0])) if area != 0]
+    if not rings:
+        return None
+    return polygon.fromRings(rings, A._axis)
+
+
+def _edges(P):
+    """start & end points of edges of polygon object (counter-clockwise), connections of rings are dropped"""
+    vert  = P.Vertices
+    rings = [np.asarray(ring) for ring in _rings(vert)]
+    start = np.concatenate([vert[ring] for ring in rings])
+    end   = np.concatenate([vert[np.roll(ring, -1)] for ring in rings])
+    if P.IsClockwise:
+        start, end = end, start
+    return start, end
+
+
+# #############################################################################
+# splitting of edges
+# #############################################################################
+
+def _split(P0, P1, i, j):
+    """
+    splits edges P0-P1 at intersections of pairs of edges i, j,
+    returns start & end points of parts of edges and index of original edge
+    """
+    t, u, parallel, collinear = _intersect(P0[i], P1[i], P0[j], P1[j])
+    eps = _Tolerance
+    
+    # start & end point of each edge
+    edges   = np.arange(len(P0))
+    records = [(edges, np.zeros(len(P0)), P0), (edges, np.ones(len(P0)), P1)]
+    
+    # crossing or touching edges, same intersection point for both edges (snapped to vertices)
+    hit = ~parallel & (t >= -eps) & (t <= 1+eps) & (u >= -eps) & (u <= 1+eps)
+    ih, jh, th, uh = i[hit], j[hit], t[hit], u[hit]
+    X = P0[ih] + th[:,None]*(P1[ih] - P0[ih])
+    X = np.where((uh <= eps)[:,None],   P0[jh], X)
+    X = np.where((uh >= 1-eps)[:,None], P1[jh], X)
+    X = np.where((th <= eps)[:,None],   P0[ih], X)
+    X = np.where((th >= 1-eps)[:,None], P1[ih], X)
+    records += [(ih, th, X), (jh, uh, X)]
+    
+    # collinear edges, split at end points of other edge
+    ic, jc = i[collinear], j[collinear]
+    for a, b in [(ic, jc), (jc, ic)]:
+        for Q in (P0[b], P1[b]):
+            records.append(( a, _project(P0[a], P1[a], Q), Q ))
+    
+    edge   = np.concatenate([record[0] for record in records])
+    param  = np.concatenate([record[1] for record in records])
+    points = np.concatenate([record[2] for record in records])
+    
+    # split points inside of edges
+    valid = (param > eps) & (param < 1-eps)
+    valid[:2*len(P0)] = True
+    edge, param, points = edge[valid], param[valid], points[valid]
+    
+    # parts of edges between consecutive points along each edge
+    order  = np.lexsort((param, edge))
+    edge   = edge[order]
+    points = points[order]
+    part   = (edge[:-1] == edge[1:]) & np.any(points[:-1] != points[1:], axis=1)
+    return points[:-1][part], points[1:][part], edge[:-1][part]
+
+
+def _shared(S, E, fromA):
+    """
+    parts of edges of A, which are also parts of edges of B in the same or opposite direction
+    (both Boolean arrays are True for the parts of edges of A and B)
+    """
+    same     = np.zeros(len(S), dtype=bool)
+    opposite = np.zeros(len(S), dtype=bool)
+    keys = np.hstack((S, E)).tolist()
+    partsA = {tuple(key): k for k, key in enumerate(keys) if fromA[k]}
+    for k in np.nonzero(~fromA)[0]:
+        sx, sy, ex, ey = keys[k]
+        if (sx, sy, ex, ey) in partsA:
+            same[[k, partsA[(sx, sy, ex, ey)]]] = True
+        elif (ex, ey, sx, sy) in partsA:
+            opposite[[k, partsA[(ex, ey, sx, sy)]]] = True
+    return same, opposite
+
+# #############################################################################
+# joining edges to rings
+# #############################################################################
+
+def _loops(S, E):
+    """
+    closed loops of directed edges S-E (start & end points),
+    a loop is closed at its first vertex, at other vertices
+    with several outgoing edges the rightmost turn is taken
+    """
+    starts = S.tolist()
+    ends   = E.tolist()
+    outgoing = {}
+    for k, start in enumerate(starts):
+        outgoing.setdefault(tuple(start), []).append(k)
+    
+    used  = np.zeros(len(S), dtype=bool)
+    loops = []
+    for first in range(len(S)):
+        if used[first]:
+            continue
+        loop = []
+        k = first
+        while True:
+            used[k] = True
+            loop.append(starts[k])
+            if ends[k] == starts[first]:
+                break
+            candidates = [c for c in outgoing.get(tuple(ends[k]), []) if not used[c]]
+            if not candidates:
+                break
+            if len(candidates) > 1:
+                din  = E[k] - S[k]
+                dout = E[candidates] - S[candidates]
+                turn = np.arctan2(din[0]*dout[:,1] - din[1]*dout[:,0], dout @ din)
+                candidates = [candidates[np.argmin(turn)]]
+            k = candidates[0]
+        loops.append(np.array(loop))
+    return loops
+
+
+def _simplify(ring):
+    """removes collinear vertices of ring (not closed), e.g. from splitting of edges"""
+    while len(ring) > 2:
+        before = ring - np.roll(ring, 1, axis=0)
+        after  = np.roll(ring, -1, axis=0) - ring
+        cross  = before[:,0]*after[:,1] - before[:,1]*after[:,0]
+        scale  = np.hypot(*before.T) * np.hypot(*after.T)
+        straight = (abs(cross) <= _Tolerance*scale) & (np.sum(before*after, axis=1) > 0)
+        if not straight.any():
+            break
+        ring = ring[~straight]
+    return ring
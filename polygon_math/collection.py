@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:     # Python < 3.8
+    shared_memory = None
+
+from polygon_math.polygon import polygon, _polygonBase, _solid, _pyplot
+
+# #############################################################################
+# collection class
+# #############################################################################
+
+class polygonCollection():
+    """
+    geometry calculation of many 2D polygons at once:
+        - area, centroid (center of mass)
+        - second moment of area (bending stiffness of beams)
+        - solids of revolution: volume, center of mass
+    
+    The vertices of all polygons are stored in one array, the properties are
+    calculated by segmented sums over the edges of all polygons.
+
+
+    creating a polygon collection:
+
+    Polygons = [Vertices0, Vertices1, ...]    # vertices of polygons, see polygon
+    instance = polygonCollection(Polygons)
+    
+    instance = polygonCollection.fromArrays(Vertices, Offsets)
+        
+        - Vertices[Offsets[k]:Offsets[k+1]] are the vertices of polygon k
+        - polygons must be closed (i.e. first = last vertex), no copy is made
+    
+    optional argument axis: solids of revolution, see polygon
+
+
+    attributes of polygon collection (arrays, one row per polygon):
+        
+        - Vertices[v,xy], Offsets[k]         vertices of all polygons
+        - IsClockwise[k]                     Boolean, order of vertices
+        - Area[k]
+        - CenterMass[k,xy]                   centroid / center of mass
+        - SecondMomentArea[k,:]              [Ixx, Iyy, Ixy], with respect to origin
+        - solids of revolution:
+            - RotationVolume[k]
+            - CenterMassCrossSection[k,rz]   CenterMass[k,rz] now relates to solid
+            - MassMomentInertia[k,:]         [polar, transverse] (density 1), see polygon
+
+
+    methods of polygon collection:
+        
+        - len(instance)                      number of polygons
+        - instance[k]                        polygon object of polygon k
+        - plot()                             contours of all polygons (single collection of lines),
+                                             only keyword arguments
+    """
+    
+    # -------------------------------------------------------
+    # constructors
+    
+    def __init__(self, Polygons, axis=None):
+        """input checks for vertices of all polygons at once, see _concatenate"""
+        self._setup(*_concatenate(Polygons), axis)
+    
+    @classmethod
+    def fromArrays(cls, Vertices, Offsets, axis=None):
+        """collection of closed polygons Vertices[Offsets[k]:Offsets[k+1]]"""
+        self = cls.__new__(cls)
+        self._setup(np.asarray(Vertices, dtype=float), np.asarray(Offsets), axis)
+        return self
+    
+    def _setup(self, vert, Offsets, axis):
+        """calculates geometrical properties of polygons"""
+        self.Vertices = vert
+        self.Offsets  = Offsets
+        self._axis    = axis
+        
+        self._AreaSigned, self.IsClockwise, self.CenterMass, self.SecondMomentArea, self._Ixy = self._geom2D(vert, Offsets)
+        self.Area = abs(self._AreaSigned)
+        
+        if axis is not None:
+            self.CenterMassCrossSection = self.CenterMass
+            self.RotationVolume, self.CenterMass = self._geom3D(axis, self._AreaSigned, self.CenterMassCrossSection, self._Ixy)
+            self.MassMomentInertia = _solid._inertia(axis, vert, self.RotationVolume, self.CenterMass, Offsets)
+    
+    # -------------------------------------------------------
+    # geometrical properties of polygons
+    
+    @staticmethod
+    def _geom2D(vert, Offsets):
+        """calculates area, centroid and second moment of area of polygons, see polygon"""
+        
+        # edges between consecutive vertices, 
+        # except from last vertex of polygon to first vertex of next polygon
+        AreaSigned, MomentSigned, IyyIxx, Ixy = _polygonBase._edgeMoments(vert[:-1], vert[1:], Offsets)
+        IsClockwise = AreaSigned < 0   # area negative for clockwise order of vertices
+        CenterMass  = MomentSigned / AreaSigned[:,None]
+        SecondMomentArea = _polygonBase._secondMoment(IyyIxx, Ixy, IsClockwise)
+        return AreaSigned, IsClockwise, CenterMass, SecondMomentArea, Ixy
+    
+    @staticmethod
+    def _geom3D(axis, _AreaSigned, CenterMassCrossSection, _Ixy):
+        """calculates volume and 3D center of mass of solids of revolution, see polygon"""
+        # Pappus's centroid theorem
+        RotationVolumeSigned = 2*np.pi * _AreaSigned * CenterMassCrossSection[:,1-axis]
+        
+        # center of mass (in polar coordinates related to product of inertia)
+        zS = 2*np.pi * _Ixy / RotationVolumeSigned
+        CenterMass = np.column_stack(( np.zeros_like(zS), zS ))
+        if axis == 0:
+            CenterMass = CenterMass[:,::-1]
+        
+        return abs(RotationVolumeSigned), CenterMass
+    
+    # -------------------------------------------------------
+    # dunder methods
+    
+    def __repr__(self):
+        return f'polygonCollection.fromArrays({self.Vertices}, {self.Offsets})'
+    
+    def __str__(self):
+        return f'Collection of {len(self)} polygons'
+    
+    def __len__(self):
+        return len(self.Offsets) - 1
+    
+    def __getitem__(self, k):
+        """polygon object of polygon k"""
+        k = range(len(self))[k]
+        return polygon(self.Vertices[self.Offsets[k]:self.Offsets[k+1]], self._axis)
+    
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+    
+    # -------------------------------------------------------
+    # methods plotting
+    
+    def plot(self, filled = False, centers = False, numbers = False, maxLabels = 1000, ax = None, **plt_kwargs):
+        """
+        contours of all polygons as one LineCollection (filled: PolyCollection)
+        centers:   optional, markers of centers of mass (single line, see polygon.plotCenterMass)
+        numbers:   optional, numbers of vertices & edges (see polygon.plot), level of detail:
+                   only largest polygons (bounding box) with at most maxLabels labels in total
+        plt_kwargs: keyword arguments of collection
+        """
+        plt = _pyplot()
+        from matplotlib.collections import LineCollection, PolyCollection
+        if ax is None:
+            ax = plt.gca()
+        
+        # polygons as views of one vertex array
+        polygons = np.split(self.Vertices, self.Offsets[1:-1])
+        if filled:
+            collection = PolyCollection(polygons, **plt_kwargs)
+        else:
+            collection = LineCollection(polygons, **plt_kwargs)
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        
+        if centers:
+            ax.plot(self.CenterMass[:,0], self.CenterMass[:,1], color='r', marker='+', linestyle='none')
+        
+        if numbers:
+            for k in self._largest(maxLabels):
+                vert = self.Vertices[self.Offsets[k]:self.Offsets[k+1]]
+                middle = (vert[:-1] + vert[1:])/2
+                for i in range(len(vert)-1):
+                    ax.text(vert[i,0],   vert[i,1],   str(i), c='r' )
+                    ax.text(middle[i,0], middle[i,1], str(i) )
+        return ax
+    
+    def _largest(self, maxLabels):
+        """indices of largest polygons (diagonal of bounding box) with at most maxLabels labels in total"""
+        start = self.Offsets[:-1]
+        size  = np.hypot(*( np.maximum.reduceat(self.Vertices, start) - np.minimum.reduceat(self.Vertices, start) ).T)
+        order = np.argsort(-size, kind='stable')
+        labels = 2*(np.diff(self.Offsets) - 1)      # vertices & edges
+        return order[np.cumsum(labels[order]) <= maxLabels]
+
+# #############################################################################
+# input checks
+# #############################################################################
+
+def _concatenate(Polygons):
+    """
+    vertices of all polygons in one array and offsets, same checks as polygon._inputChecks
+    (coordinates as 2 columns, first = last vertex), the closing vertices are tested
+    and inserted for all polygons at once, no polygons: Offsets = [0]
+    """
+    vert = [np.asarray(Vertices, dtype=float) for Vertices in Polygons]
+    if not vert:
+        return np.empty((0, 2)), np.zeros(1, dtype=np.int64)
+    vert = [v.T if v.shape[0] < v.shape[1] else v for v in vert]
+    lengths = np.array([len(v) for v in vert], dtype=np.int64)
+    vert = np.concatenate(vert)
+    ends = np.cumsum(lengths)
+    
+    # first = last vertex
+    first = vert[ends - lengths]
+    unclosed = ~np.isclose(vert[ends - 1], first).all(axis=1)
+    vert = np.insert(vert, ends[unclosed], first[unclosed], axis=0)
+    Offsets = np.append(0, ends + np.cumsum(unclosed))
+    return vert, Offsets
+
+# #############################################################################
+# parallel evaluation
+# #############################################################################
+
+def mapProperties(Polygons, axis = None, workers = None):
+    """
+    geometrical properties of many polygons, calculated in parallel processes
+    
+    Polygons: list of vertices of polygons or polygonCollection
+    axis:     optional, solids of revolution, see polygon
+    workers:  number of processes (default number of CPUs)
+    
+    returns dictionary of arrays (one row per polygon):
+        Area, CenterMass, SecondMomentArea
+        solids of revolution: RotationVolume, CenterMassCrossSection, MassMomentInertia
+    
+    The vertices and results are exchanged with the processes by shared
+    memory, each process calculates a chunk of polygons as polygonCollection.
+    """
+    if isinstance(Polygons, polygonCollection):
+        vert, Offsets = Polygons.Vertices, Polygons.Offsets
+    else:
+        vert, Offsets = _concatenate(Polygons)
+    
+    # results: name, columns
+    names = [('Area', None), ('CenterMass', 2), ('SecondMomentArea', 3)]
+    if axis is not None:
+        names += [('RotationVolume', None), ('CenterMassCrossSection', 2), ('MassMomentInertia', 2)]
+    shapes = {name: (len(Offsets)-1,) if columns is None else (len(Offsets)-1, columns) for name, columns in names}
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or shared_memory is None:
+        collection = polygonCollection.fromArrays(vert, Offsets, axis)
+        return {name: getattr(collection, name) for name in shapes}
+    
+    # shared memory for vertices, offsets and results
+    arrays = dict(Vertices=np.asarray(vert, dtype=float), Offsets=np.asarray(Offsets, dtype=np.int64))
+    arrays.update({name: np.empty(shape) for name, shape in shapes.items()})
+    blocks = {}
+    try:
+        for name, array in arrays.items():
+            blocks[name] = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            _sharedArray(blocks[name], array.shape, array.dtype)[...] = array
+        layout = {name: (blocks[name].name, array.shape, array.dtype.str) for name, array in arrays.items()}
+        
+        # chunks of polygons, several per process for load balancing
+        bounds = np.linspace(0, len(Offsets)-1, 4*workers+1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = [(layout, k0, k1, axis) for k0, k1 in zip(bounds[:-1], bounds[1:]) if k1 > k0]
+            list(executor.map(_mapChunk, chunks))
+        
+        return {name: _sharedArray(blocks[name], shape, np.float64).copy() for name, shape in shapes.items()}
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def _sharedArray(block, shape, dtype):
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _mapChunk(args):
+    """calculates properties of polygons k0 to k1 in process"""
+    layout, k0, k1, axis = args
+    blocks = {name: shared_memory.SharedMemory(name=block) for name, (block, shape, dtype) in layout.items()}
+    try:
+        arrays = {name: _sharedArray(blocks[name], shape, np.dtype(dtype)) for name, (block, shape, dtype) in layout.items()}
+        Offsets = arrays['Offsets'][k0:k1+1]
+        collection = polygonCollection.fromArrays(arrays['Vertices'][Offsets[0]:Offsets[-1]], Offsets - Offsets[0], axis)
+        for name in arrays:
+            if name not in ('Vertices', 'Offsets'):
+                arrays[name][k0:k1] = getattr(collection, name)
+        del arrays, collection
+    finally:
+        for block in blocks.values():
+            block.close()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from polygon_math.triangulation import _rings
+
+# #############################################################################
+# triangulated surface of solids of revolution
+# #############################################################################
+
+# record of triangle of binary STL file (50 bytes, little endian)
+_STL = np.dtype([('Normal', '<f4', (3,)), ('Vertices', '<f4', (3,3)), ('Attribute', '<u2')])
+
+
+def revolve(vert, axis, Nangle = 64):
+    """
+    triangulated surface of solid of revolution of closed polygon vert,
+    axis of rotation is the z-axis (as in plot3d), Nangle points per circle
+    returns Points[p,xyz] and Triangles[k,:] (indices of points, normals outwards)
+    
+    Each edge of the cross-section (rings, connections of holes are dropped)
+    sweeps a band of 2*Nangle triangles, vertices on the axis are a single point
+    (degenerated triangles are dropped).
+    """
+    from polygon_math.polygon import _polygonBase     # polygon module imports mesh
+    vert = vert[:, ::-1] if axis == 0 else vert    # [r, z]
+    rings = [np.asarray(ring) for ring in _rings(vert)]
+    start = np.concatenate([ring for ring in rings])
+    end   = np.concatenate([np.roll(ring, -1) for ring in rings])
+    
+    # points of used vertices, Nangle points per circle (1 on axis)
+    used, inverse = np.unique(np.append(start, end), return_inverse=True)
+    radius, height = vert[used,0], vert[used,1]
+    counts  = np.where(radius == 0, 1, Nangle)
+    offsets = np.cumsum(counts) - counts
+    k = np.arange(counts.sum()) - np.repeat(offsets, counts)
+    angle = 2*np.pi * k / Nangle
+    r = np.repeat(radius, counts)
+    Points = np.column_stack(( r*np.cos(angle), r*np.sin(angle), np.repeat(height, counts) ))
+    
+    # indices of points [vertex, angle]
+    k = np.arange(Nangle)
+    index = offsets[:,None] + np.where(radius[:,None] == 0, 0, k)
+    a = index[inverse[:len(start)]]
+    b = index[inverse[len(start):]]
+    a1, b1 = np.roll(a, -1, axis=1), np.roll(b, -1, axis=1)
+    Triangles = np.concatenate(( np.stack((a, b, b1), axis=-1).reshape(-1,3),
+                                 np.stack((a, b1, a1), axis=-1).reshape(-1,3) ))
+    
+    # degenerated triangles, orientation (normals inwards for counter-clockwise cross-section [r,z])
+    degenerated = (Triangles[:,0] == Triangles[:,1]) | (Triangles[:,1] == Triangles[:,2]) | (Triangles[:,2] == Triangles[:,0])
+    Triangles = Triangles[~degenerated]
+    if _polygonBase._area(vert) > 0:
+        Triangles = Triangles[:, ::-1]
+    return Points, np.ascontiguousarray(Triangles)
+
+
+def writeMesh(filename, Points, Triangles):
+    """writes triangles Points[Triangles] as binary STL (.stl) or Wavefront OBJ (.obj) file"""
+    suffix = str(filename).lower().rsplit('.', 1)[-1]
+    if suffix == 'stl':
+        _writeSTL(filename, Points, Triangles)
+    elif suffix == 'obj':
+        _writeOBJ(filename, Points, Triangles)
+    else:
+        raise ValueError(f'unknown mesh format: {filename} (.stl or .obj)')
+
+
+def _writeSTL(filename, Points, Triangles):
+    """binary STL, records of all triangles in one structured array"""
+    vert = Points[Triangles]
+    normal = np.cross(vert[:,1] - vert[:,0], vert[:,2] - vert[:,0])
+    length = np.linalg.norm(normal, axis=1, keepdims=True)
+    records = np.zeros(len(Triangles), dtype=_STL)
+    records['Normal']   = np.divide(normal, length, out=np.zeros_like(normal), where=length > 0)
+    records['Vertices'] = vert
+    with open(filename, 'wb') as file:
+        file.write(b'binary STL, solid of revolution, polygon_math'.ljust(80, b' '))
+        file.write(np.uint32(len(records)).astype('<u4').tobytes())
+        records.tofile(file)
+
+
+def _writeOBJ(filename, Points, Triangles):
+    """Wavefront OBJ, shared points (indices start at 1)"""
+    with open(filename, 'w') as file:
+        file.write('# solid of revolution, polygon_math\n')
+        np.savetxt(file, Points, fmt='v %.17g %.17g %.17g')
+        np.savetxt(file, Triangles + 1, fmt='f %d %d %d')
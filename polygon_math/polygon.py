@@ -1,10 +1,62 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-import matplotlib.pyplot as plt
 import warnings
 import copy
 
+from polygon_math.triangulation import earcut
+from polygon_math.sweep import _selfIntersections
+from polygon_math.simplification import simplifyVertices
+from polygon_math.raster import rasterize
+from polygon_math.mesh import revolve, writeMesh
+
+# #############################################################################
+# optional dependencies
+# #############################################################################
+
+def _pyplot():
+    """matplotlib is imported on first plot (faster import, optional dependency)"""
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as error:
+        raise ImportError('plotting requires matplotlib: pip install polygon-math[plot]') from error
+    return plt
+
+# #############################################################################
+# lazy attributes
+# #############################################################################
+
+class _lazy():
+    """
+    attribute calculated by method on first access, the value is cached
+    in the instance attribute _lazy<name>
+    """
+    
+    def __init__(self, method):
+        self._method = method
+        self.__doc__ = method.__doc__
+    
+    def __set_name__(self, owner, name):
+        self._name = '_lazy' + name
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self._name)
+        except AttributeError:
+            value = self._method(instance)
+            setattr(instance, self._name, value)
+            return value
+    
+    def __set__(self, instance, value):
+        setattr(instance, self._name, value)
+    
+    @staticmethod
+    def slots(*names):
+        """names of instance attributes for caching lazy attributes"""
+        return tuple('_lazy' + name for name in names)
+
 # #############################################################################
 # selector class
 # #############################################################################
@@ -18,6 +70,7 @@ class polygon():
         - solid of revolution: volume, surface areas, center of mass
         - check if point is inside or on edge of polygon
         - move, rotate and scale polygon
+        - union, intersection and difference of polygons
         - plotting with matplotlib arguments (e.g. color, linestyle, label)
 
 
@@ -29,6 +82,16 @@ class polygon():
         - polygon can be open or closed (i.e. first = last vertex)
         - holes can be defined by self-intersecting and opposite order of vertices inside than outside
 
+    instance = polygon.fromRings([Vertices0, Vertices1, ...])
+        
+        - rings (e.g. outer contour and holes) connected to first vertex of first ring
+        - holes need opposite order of vertices than outer contour
+    
+    instance = polygon.fromClosedArray(Vertices)
+        
+        - trusted constructor without input checks for closed polygons (first = last vertex)
+        - no copy is made of contiguous float64 arrays with 2 columns
+
 
     creating a solid of revolution
         
@@ -47,12 +110,16 @@ class polygon():
         - Angles[v]                            inner angles
         - EdgesLength[e]
         - EdgesMiddle[xe,ye]                   midpoints of edges
+        - Triangles[t,i]                       indices of vertices of triangles (triangulation),
+                                               holes and connecting edges are excluded
         - CenterMass[x,y]                      centroid / center of mass
         - SecondMomentArea                     [Ixx, Iyy, Ixy], with respect to origin
         - solid of revolution:
             - RotationVolume
             - RotationSurfaces[e]
             - CenterMassCrossSection[r,z]      CenterMass[r,z] now relates to solid
+            - MassMomentInertia                [polar, transverse] mass moments of inertia (density 1),
+                                               transverse axis through center of mass
         - triangles:
             - CenterOuterCircle[x,y]           circumcenter / center of circumsribed (outer) circle
             - RadiusOuterCircle                radius of circumsribed (outer) circle
@@ -70,15 +137,24 @@ class polygon():
             - plotCenterEdges
             - solid of revolution:
                 - plot3d                        3D wireframe plot of solid
+                - wireframe                     coordinates of 3D wireframe (lines separated by NaN)
                 - plotRotationAxis              only keyword arguments
                 - plotCenterMassCrossSection    for 2D plot
             - triangles:
                 - plotOutCircle                 circumscribed (outer) circle
                 - plotIncircle                  incircle (inner circle)
         
+        - mesh export of solid of revolution
+            - surfaceMesh(Nangle)                      triangulated surface Points[p,xyz], Triangles[k,:] (normals outwards)
+            - exportMesh(filename, Nangle)             binary STL (.stl) or OBJ (.obj) file of triangulated surface
+        
         - point testing
             - instance(point), isPointInside(point)    true, if point [x,y] is inside of polygon (not on the edge)
+                                                       Boolean array for array of points [[x0,y0],[x1,y1],...]
             - isPointOnEdge(point)                     true, if point [x,y] is on any edge of polygon
+            - distanceEdges(point)                     on any edge, index of & distance to nearest edge (negative inside)
+            - selfIntersections()                      pairs of indices of intersecting edges (empty if polygon is simple)
+            - rasterize((H,W), extent, coverage)       pixel mask of inside of polygon (Boolean or coverage)
         
         - manipulation (translation, rotation & scaling)
             - instance + [dx,dy] , instance - [dx,dy] , move([dx,dy])
@@ -94,17 +170,87 @@ class polygon():
             - instance * [fx,fy] , instance / [fx,fy] , scale([fx,fy],[cx,cy])
                     scaling by factors fx, fy in x,y-direction (negative: flip)
                     with respect to point [cx,cy] (optional, default center of mass)
+            
+            - simplify(tolerance, method)
+                    simplified copy of polygon, method 'douglas-peucker' (tolerance: distance of removed vertices)
+                    or 'visvalingam' (tolerance: area of triangle of removed vertex and neighbours),
+                    each ring (outer contour, holes) keeps at least 3 vertices,
+                    returns polygon and differences of Area, CenterMass and SecondMomentArea
+            
+            - transform()
+                    lazy transformation with the same methods and operators as above, which are
+                    combined into one matrix (attribute Matrix) and applied at once by apply(),
+                    e.g. ((instance.transform() - [cx,cy]).rotate(30) * [2,1]).apply()
+                    area, center of mass & second moment of area are transformed analytically
+        
+        - editing vertices (in place, e.g. interactive tools)
+            - moveVertex(i,[x,y])      moves vertex i
+            - insertVertex(i,[x,y])    inserts vertex before vertex i
+            - deleteVertex(i)          deletes vertex i
+                    calculated area, center of mass, second moment of area, lengths & midpoints of edges
+                    and angles are updated from the edges at the vertex (no recalculation of all edges)
+        
+        - boolean operations (returns polygon object, None if empty)
+            - instance | other , union(other)
+            - instance & other , intersection(other)
+            - difference(other)                instance without other
+                    outer contours counter-clockwise, holes clockwise and connected to outer contour
+
+
+    settings (class attributes of polygon):
+        
+        - polygon.AnalyticTransforms True: already calculated area, center of mass, second moment of area,
+                                     midpoints & lengths of edges, angles and triangles are transformed analytically 
+                                     for transformed copies (move, rotate, scale, operators), 
+                                     instead of recalculation from vertices (default False)
+        - polygon.IndexThreshold     number of queried points after which a spatial index of the edges
+                                     is built to speed up point testing (None: never)
 
     @author: Gerrit Nowald
     """
     
+    # transformed copies (move, rotate, scale, operators) get already calculated properties
+    # transformed analytically instead of recalculating them from the vertices
+    AnalyticTransforms = False
+    
+    # number of queried points after which a spatial index is built for point testing
+    # (None: never), the index is bound to the vertices, transformed copies build their own
+    IndexThreshold = 1000
+    
     def __new__(self, Vertices, axis=None):
         """input checks for vertices and selection of specialized class"""
+        vert = polygon._inputChecks(Vertices)
+        return polygon._select(vert, axis)
+    
+    @staticmethod
+    def fromClosedArray(Vertices, axis=None):
+        """
+        trusted constructor without input checks, 
+        Vertices: closed polygon (first = last vertex) as array with 2 columns,
+        no copy is made for contiguous float64 arrays
+        """
+        vert = np.ascontiguousarray(Vertices, dtype=float)
+        return polygon._select(vert, axis)
+    
+    @staticmethod
+    def fromRings(Rings, axis=None):
+        """
+        polygon from several closed rings (e.g. outer contour and holes),
+        the rings are connected by edges to the first vertex of the first ring,
+        which are passed in both directions (no contribution to area)
+        holes need opposite order of vertices than outer contour
+        """
+        rings = [polygon._inputChecks(Vertices) for Vertices in Rings]
+        vert  = [rings[0]]
+        for ring in rings[1:]:
+            vert += [ring, rings[0][:1]]
+        return polygon(np.concatenate(vert), axis)
+    
+    @staticmethod
+    def _inputChecks(Vertices):
+        """vertices as 2 columns, first = last vertex"""
         
-        # -------------------------------------------------------
-        # input checks
-        
-        vert = np.array(Vertices)   # shallow copy
+        vert = np.asarray(Vertices)
         
         # coordinates as 2 columns (min 3 rows)
         if vert.shape[0] < vert.shape[1]:
@@ -112,25 +258,35 @@ class polygon():
         
         # first = last vertex
         if not np.isclose(vert[-1,], vert[0,]).all():
-            vert = np.append(vert, [vert[0,]], axis=0)
+            vert = np.concatenate((vert, vert[:1,]))
+        else:
+            vert = vert.copy()      # shallow copy
+        
+        return vert
+    
+    @staticmethod
+    def _select(vert, axis):
+        """selection of specialized class"""
+        return polygon._specialized(len(vert)-1, axis)(vert, axis)
         
-        # -------------------------------------------------------
-        # choose subclass
+    @staticmethod
+    def _specialized(vertices, axis):
+        """specialized class for number of vertices and axis"""
         
-        isTriangle = len(vert)-1 == 3
+        isTriangle = vertices == 3
         isSolidRev = axis is not None
         
         if isTriangle and not isSolidRev:
-            return _triangle(vert, axis)
+            return _triangle
         
         elif isSolidRev and not isTriangle:
-            return _solid(vert, axis)
+            return _solid
         
         elif isSolidRev and isTriangle:
-            return _solid_and_triangle(vert, axis)
+            return _solid_and_triangle
         
         else:
-            return _polygonBase(vert, axis)
+            return _polygonBase
 
 # #############################################################################
 # base class
@@ -138,69 +294,185 @@ class polygon():
 
 class _polygonBase():
     
+    # name of centroid of area
+    _Centroid = 'CenterMass'
+    
+    # attributes of instances, including the cached lazy attributes of 
+    # the subclasses (only one base class of _solid_and_triangle may have slots)
+    __slots__ = ('Vertices', '_axis', '_Index', '_Queries', '_OwnVertices') + _lazy.slots(
+        '_AreaSigned', '_MomentSigned', 'CenterMass', '_Ixy', '_IyyIxx', 'SecondMomentArea', 'EdgesMiddle', 'EdgesLength', 'Angles', 'Triangles',
+        'CenterOuterCircle', 'RadiusOuterCircle', 'CenterInnerCircle', 'RadiusInnerCircle',
+        'CenterMassCrossSection', 'RotationVolume', 'RotationSurfaces', 'MassMomentInertia')
+    
+    # maximum number of point-edge combinations evaluated at once in point tests
+    _ChunkSize = 2**20
+    
+    # minimum number of vertices for building a spatial index
+    _IndexMinEdges = 64
+    
     # -------------------------------------------------------
-    # constructor (geometrical properties)
+    # constructor (geometrical properties calculated on first access)
     
     def __init__(self, vert, axis):
-        """calculates geometrical properties of polygon"""
         
         self.Vertices = vert
         self._axis    = axis
-        
-        self.EdgesMiddle, self._AreaSigned, self.IsClockwise, self.CenterMass, self.SecondMomentArea, self._Ixy = self._geom2D(vert)
-        self.Area = abs(self._AreaSigned)
-        
-        self.EdgesLength, self.Angles = self._edges(vert)
-        
+        self._Index   = None    # spatial index for point testing, built on demand
+        self._Queries = 0       # number of queried points
+        self._OwnVertices = False   # vertices are copied before first edit
+    
     # -------------------------------------------------------
     # geometrical properties of polygon
     
+    @_lazy
+    def _AreaSigned(self):
+        """area, negative for clockwise order of vertices"""
+        return self._area(self.Vertices)
+    
+    @property
+    def IsClockwise(self):
+        """order of vertices"""
+        return self._AreaSigned < 0   # area negative for clockwise order of vertices
+    
+    @property
+    def Area(self):
+        return abs(self._AreaSigned)
+    
+    @_lazy
+    def _MomentSigned(self):
+        """first moment of area [Sy, Sx] (integral of [x,y]), negative for clockwise order of vertices"""
+        CenterMass = self._cached(self._Centroid)   # e.g. stored properties, see polygonStore
+        if CenterMass is not None:
+            return CenterMass * self._AreaSigned
+        return self._edgeMoments(self.Vertices[:-1], self.Vertices[1:], second=False)[1]
+    
+    @_lazy
+    def CenterMass(self):
+        """centroid / center of mass"""
+        return self._MomentSigned / self._AreaSigned
+    
+    @_lazy
+    def _Ixy(self):
+        """product of inertia, negative for clockwise order of vertices"""
+        return self._secondMoments()[1]
+    
+    @_lazy
+    def _IyyIxx(self):
+        """[Iyy, Ixx] with respect to origin, negative for clockwise order of vertices"""
+        return self._secondMoments()[0]
+    
+    @_lazy
+    def SecondMomentArea(self):
+        """[Ixx, Iyy, Ixy], with respect to origin"""
+        return self._secondMoment(self._IyyIxx, self._Ixy, self.IsClockwise)
+    
+    @_lazy
+    def EdgesMiddle(self):
+        """midpoints of edges"""
+        return (self.Vertices[:-1] + self.Vertices[1:])/2
+    
+    @_lazy
+    def EdgesLength(self):
+        return self._edgesLength(self.Vertices)
+    
+    @_lazy
+    def Angles(self):
+        """inner angles"""
+        return self._angles(self.Vertices)
+    
+    @_lazy
+    def Triangles(self):
+        """indices of vertices of triangles (triangulation by ear clipping)"""
+        return earcut(self.Vertices)
+    
     @staticmethod
-    def _geom2D(vert):
-        """calculates area, centroid and second moment of area of polygon"""
-        
-        # centers of edges
+    def _shoelace(vert):
+        """edge vectors and terms of Gauss's area formula"""
         ri   = vert[:-1]
         rip1 = vert[1:]
-        EdgesMiddle = (ri + rip1)/2
-        
-        # area (Gauss's area formula, 0th moment of area)
-        # https://en.wikipedia.org/wiki/Shoelace_formula
-        xi   =   ri[:,0]
-        yi   =   ri[:,1]
-        xip1 = rip1[:,0]
-        yip1 = rip1[:,1]
-        FM   = xi*yip1 - xip1*yi
-        AreaSigned  = sum(FM)/2
-        IsClockwise = AreaSigned < 0   # area negative for clockwise order of vertices
-        
-        # center of mass (1st moment of area / area)
-        CenterMass = FM @ EdgesMiddle /3/AreaSigned
-        
-        # second moment of area
-        # https://en.wikipedia.org/wiki/Second_moment_of_area
-        Brr    = ri**2 + ri*rip1 + rip1**2
-        Bxy    = xi*yip1 + 2*xi*yi + 2*xip1*yip1 + xip1*yi
-        IyyIxx = FM @ Brr / 12
-        Ixy    = FM @ Bxy / 24
-        SecondMomentArea = np.hstack(( abs(IyyIxx[::-1]), -Ixy*(-1)**IsClockwise ))
-        
-        return EdgesMiddle, AreaSigned, IsClockwise, CenterMass, SecondMomentArea, Ixy
+        FM   = ri[:,0]*rip1[:,1] - rip1[:,0]*ri[:,1]
+        return ri, rip1, FM
     
     @staticmethod
-    def _edges(vert):
-        """calculates lengths of edges and inner angles of polygon"""
-        
-        # lengths of edges
+    def _area(vert):
+        """
+        signed area (Gauss's area formula, 0th moment of area)
+        https://en.wikipedia.org/wiki/Shoelace_formula
+        """
+        FM = _polygonBase._shoelace(vert)[2]
+        return np.sum(FM)/2
+    
+    def _secondMoments(self):
+        """signed second moments [Iyy, Ixx] and product of inertia (one pass over the edges, both are cached)"""
+        self._IyyIxx, self._Ixy = self._edgeMoments(self.Vertices[:-1], self.Vertices[1:])[2:]
+        return self._IyyIxx, self._Ixy
+    
+    @staticmethod
+    def _edgeSum(FM, terms = None, Offsets = None):
+        """
+        sum of terms of edges weighted by FM (terms None: sum of FM),
+        Offsets: optional, sums of each polygon of collection
+        """
+        if Offsets is None:
+            return np.sum(FM) if terms is None else FM @ terms
+        if terms is not None:
+            FM = FM[:,None]*terms if terms.ndim > 1 else FM*terms
+        return np.add.reduceat(FM, Offsets[:-1], axis=0)
+    
+    @staticmethod
+    def _edgeMoments(ri, rip1, Offsets = None, second = True):
+        """
+        signed area, first moment [Sy, Sx], second moments [Iyy, Ixx] and product of inertia
+        as sums of the terms of the edges ri -> rip1 (Green's theorem), negative for clockwise order
+        Offsets: optional, sums of each polygon of collection (vertices ri = vert[:-1], rip1 = vert[1:],
+                 edges from last vertex of polygon to first vertex of next polygon are excluded)
+        second:  optional, also second moments (else only area and first moment)
+        used by polygon, polygonCollection and edits of vertices (differences of paths)
+        """
+        FM  = ri[:,0]*rip1[:,1] - rip1[:,0]*ri[:,1]
+        if Offsets is not None:
+            FM[Offsets[1:-1]-1] = 0
+        Sum = lambda terms = None: _polygonBase._edgeSum(FM, terms, Offsets)
+        moments = [Sum()/2, Sum(ri + rip1)/6]
+        if second:
+            Brr = ri**2 + ri*rip1 + rip1**2
+            Bxy = ri[:,0]*rip1[:,1] + 2*ri[:,0]*ri[:,1] + 2*rip1[:,0]*rip1[:,1] + rip1[:,0]*ri[:,1]
+            moments += [Sum(Brr)/12, Sum(Bxy)/24]
+        return moments
+    
+    @staticmethod
+    def _secondMoment(IyyIxx, Ixy, IsClockwise):
+        """
+        second moment of area [Ixx, Iyy, Ixy] from signed moments (also rows of polygons)
+        https://en.wikipedia.org/wiki/Second_moment_of_area
+        """
+        Ixy = -np.asarray(Ixy)*(-1)**IsClockwise
+        return np.concatenate(( abs(IyyIxx[...,::-1]), Ixy[...,None] ), axis=-1)
+    
+    @staticmethod
+    def _edgeVectors(vert):
+        """direction vectors and lengths of edges, starting with last edge"""
         vertext = np.append([vert[-2,]], vert, axis=0) # second last in front of first vertex
         vec = np.diff(vertext, axis=0)                 # direction vectors of edges
         L   = np.linalg.norm(vec, ord=2, axis=1)       # length of edges (Pythagorean theorem)
-        EdgesLength = L[1:]
-        
-        # inner angles (law of cosines)
-        angles = np.pi - np.arccos( np.sum( vec[:-1,]*vec[1:,], axis=1 ) / (L[:-1]*L[1:]) )
-        
-        return EdgesLength, np.degrees(angles)
+        return vec, L
+    
+    @staticmethod
+    def _edgesLength(vert):
+        """lengths of edges"""
+        return np.linalg.norm(np.diff(vert, axis=0), ord=2, axis=1)
+    
+    @staticmethod
+    def _angles(vert):
+        """inner angles of polygon (law of cosines)"""
+        vec, L = _polygonBase._edgeVectors(vert)
+        return _polygonBase._anglesBetween(vec[:-1,], vec[1:,], L[:-1], L[1:])
+    
+    @staticmethod
+    def _anglesBetween(vecIn, vecOut, LIn, LOut):
+        """inner angles at vertices between incoming & outgoing edges (direction vectors and lengths)"""
+        angles = np.pi - np.arccos( np.sum( vecIn*vecOut, axis=1 ) / (LIn*LOut) )
+        return np.degrees(angles)
     
     # -------------------------------------------------------
     # dunder methods
@@ -224,7 +496,7 @@ class _polygonBase():
         numbers: optional, numbers of vertices & edges
         """
         if ax is None:
-            ax = plt.gca()
+            ax = _pyplot().gca()
         # plot contour of polygon
         ax.plot(self.Vertices[:,0], self.Vertices[:,1], *plt_args, **plt_kwargs)
         # plot numbers of vertices & edges
@@ -236,7 +508,7 @@ class _polygonBase():
     
     def plotCenterMass(self, *plt_args, ax = None, **plt_kwargs):
         if ax is None:
-            ax = plt.gca()
+            ax = _pyplot().gca()
         if not plt_args:
             if 'color' not in plt_kwargs:
                 plt_kwargs['color']  = 'r'
@@ -253,7 +525,7 @@ class _polygonBase():
     
     def plotCenterEdges(self, *plt_args, ax = None, **plt_kwargs):
         if ax is None:
-            ax = plt.gca()
+            ax = _pyplot().gca()
         if not plt_args:
             if 'color' not in plt_kwargs:
                 plt_kwargs['color']     = 'k'
@@ -268,7 +540,7 @@ class _polygonBase():
     def _plot_circ(*plt_args, radius = 1, center = (0,0), Npoints = 50, ax = None, **plt_kwargs ):
         """circle in (or parallel to) x,y plane"""
         if ax is None:
-            ax = plt.gca()
+            ax = _pyplot().gca()
         # calculate circle coordinates
         angle = np.linspace(0, 2*np.pi, Npoints+1)
         x = center[0] + radius*np.cos(angle)
@@ -293,7 +565,7 @@ class _polygonBase():
     def move(self, distances):
         """creates copy of polygon translated in x,y direction"""
         Vertices_new = self._move(self.Vertices, distances)
-        return polygon(Vertices_new, self._axis)
+        return self._copy(Vertices_new, lambda T: T.move(distances))
     def centerOrigin(self):
         """creates copy of polygon with center of mass at origin"""
         return self.move(- self.CenterMass )
@@ -317,7 +589,7 @@ class _polygonBase():
         if point is None:
             point = self.CenterMass
         Vertices_new = self._rotate(self.Vertices, angle, point)
-        return polygon(Vertices_new, self._axis)
+        return self._copy(Vertices_new, lambda T: T.rotate(angle, point))
     def rotateClockwise(self, angle, point=None):
         """creates copy of polygon rotated in clockwise direction"""
         return self.rotate(-angle, point)
@@ -333,7 +605,7 @@ class _polygonBase():
         if point is None:
             point = self.CenterMass
         Vertices_new = self._scale(self.Vertices, factors, point)
-        return polygon(Vertices_new, self._axis)
+        return self._copy(Vertices_new, lambda T: T.scale(factors, point))
     def __mul__(self, factors):
         """creates scaled copy of polygon"""
         return self.scale(factors)
@@ -341,36 +613,391 @@ class _polygonBase():
         """creates scaled copy of polygon"""
         return self.scale( 1/np.array(factors) )
     
+    
+    # affine transformation (translations, rotations & scalings combined)
+    def transform(self):
+        """
+        lazy transformation: translations, rotations & scalings are combined 
+        into one matrix, apply() creates the transformed copy of polygon
+        """
+        return _transformation(self)
+    
+    def _copy(self, Vertices_new, transformation):
+        """
+        creates copy of polygon with transformed vertices, 
+        see polygon.AnalyticTransforms
+        transformation: function of _transformation object, e.g. lambda T: T.move(distances)
+        """
+        if polygon.AnalyticTransforms:
+            return self._affine(transformation(_transformation(self)).Matrix, Vertices_new)
+        return polygon._select(Vertices_new, self._axis)
+    
+    def _affine(self, M, Vertices_new):
+        """
+        creates copy of polygon with transformed vertices,
+        already calculated properties are transformed by matrix M
+        """
+        new = polygon._select(Vertices_new, self._axis)
+        
+        # second moments are transformed signed (calculated once, if only partly cached)
+        SecondMomentArea = self._cached('SecondMomentArea')
+        if any(self._cached(name) is not None for name in ('SecondMomentArea', '_IyyIxx', '_Ixy')):
+            AreaSigned, MomentSigned = self._AreaSigned, self._MomentSigned
+            IyyIxx, Ixy = self._IyyIxx, self._Ixy
+        else:
+            moment = any(self._cached(name) is not None for name in ('_MomentSigned', self._Centroid))
+            AreaSigned = self._cached('_AreaSigned')
+            MomentSigned = self._MomentSigned if moment else None
+            IyyIxx, Ixy = None, None
+        AreaSigned, MomentSigned, IyyIxx, Ixy = self._affineProperties(M, AreaSigned, MomentSigned, IyyIxx, Ixy)
+        properties = [('_AreaSigned', AreaSigned), ('_MomentSigned', MomentSigned), ('_IyyIxx', IyyIxx), ('_Ixy', Ixy)]
+        if SecondMomentArea is not None:
+            properties.append(( 'SecondMomentArea', self._secondMoment(IyyIxx, Ixy, AreaSigned < 0) ))
+        
+        # midpoints of edges are transformed like vertices
+        EdgesMiddle = self._cached('EdgesMiddle')
+        if EdgesMiddle is not None:
+            properties.append(( 'EdgesMiddle', EdgesMiddle @ M[:2,:2].T + M[:2,2] ))
+        
+        # triangulation is kept by (non-singular) affine transformations
+        if not np.isclose(np.linalg.det(M[:2,:2]), 0):
+            properties.append(( 'Triangles', self._cached('Triangles') ))
+        
+        # similarity transformation (A^T A = s^2 I): lengths are scaled by s, angles are kept
+        AtA = M[:2,:2].T @ M[:2,:2]
+        if np.isclose(AtA[0,1], 0) and np.isclose(AtA[0,0], AtA[1,1]):
+            EdgesLength, Angles = self._cached('EdgesLength'), self._cached('Angles')
+            if EdgesLength is not None:
+                properties.append(( 'EdgesLength', EdgesLength * np.sqrt(AtA[0,0]) ))
+            if Angles is not None:
+                properties.append(( 'Angles', Angles ))
+        
+        for name, value in properties:
+            if value is not None:
+                setattr(new, name, value)
+        return new
+    
+    def _cached(self, name):
+        """value of lazy attribute, None if not calculated yet"""
+        return getattr(self, '_lazy' + name, None)
+    
+    @staticmethod
+    def _affineProperties(M, AreaSigned, MomentSigned, IyyIxx, Ixy):
+        """
+        signed area, signed first moment and signed second moments [Iyy, Ixx], Ixy after affine
+        transformation r' = A r + b, with M = [[A, b], [0, 1]] (None if not available)
+        The tensor of second moments is transformed like A J A^T, the 
+        translation follows from the parallel axis theorem (Steiner).
+        All integrals are signed (negative for clockwise order of vertices),
+        so they are also valid for self-intersecting polygons.
+        https://en.wikipedia.org/wiki/Parallel_axis_theorem
+        """
+        A = M[:2,:2]
+        b = M[:2,2]
+        detA = np.linalg.det(A)
+        if AreaSigned is None:
+            return None, None, None, None
+        AreaSigned_new = detA * AreaSigned
+        if MomentSigned is None:
+            return AreaSigned_new, None, None, None
+        S = MomentSigned                                # first moment of area
+        MomentSigned_new = detA * ( A @ S + AreaSigned*b )
+        if IyyIxx is None or Ixy is None:
+            return AreaSigned_new, MomentSigned_new, None, None
+        # tensor of second moments J = integral of r r^T over area
+        J = np.array([[IyyIxx[0], Ixy], [Ixy, IyyIxx[1]]])
+        J = detA * ( A @ J @ A.T + np.outer(A @ S, b) + np.outer(b, A @ S) + AreaSigned*np.outer(b, b) )
+        return AreaSigned_new, MomentSigned_new, np.array([ J[0,0], J[1,1] ]), J[0,1]
+    
+    # simplification (fewer vertices within tolerance)
+    def simplify(self, tolerance, method = 'douglas-peucker'):
+        """
+        creates simplified copy of polygon, method 'douglas-peucker' (tolerance: distance)
+        or 'visvalingam' (tolerance: area of triangle of removed vertex and neighbours),
+        each ring keeps at least 3 vertices, returns polygon and dictionary of differences
+        of Area, CenterMass and SecondMomentArea (simplified - original)
+        """
+        new = polygon._select(simplifyVertices(self.Vertices, tolerance, method), self._axis)
+        differences = {name: np.subtract(getattr(new, name), getattr(self, name))
+                       for name in ('Area', 'CenterMass', 'SecondMomentArea')}
+        return new, differences
+    
+    
+    # -------------------------------------------------------
+    # methods editing vertices (in place)
+    
+    def moveVertex(self, i, point):
+        """
+        moves vertex i to point [x,y], calculated properties are updated
+        from the terms of the two edges at the vertex (O(1))
+        """
+        n = len(self.Vertices) - 1
+        i %= n
+        prev, next = (i-1) % n, (i+1) % n
+        old = self.Vertices[[prev, i, next]]
+        new = old.astype(float)
+        new[1] = point
+        self._updateMoments(old, new)
+        
+        vert = self._ownVertices()
+        vert[i] = point
+        vert[-1] = vert[0]
+        self._updateEdges([prev, i], [prev, i, next])
+    
+    def insertVertex(self, i, point):
+        """
+        inserts vertex [x,y] before vertex i (on edge i-1), calculated properties
+        are updated from the terms of the split edge (arrays are copied once)
+        """
+        n = len(self.Vertices) - 1
+        i %= n + 1
+        old = self.Vertices[[(i-1) % n, i % n]]
+        new = np.vstack(( old[0], point, old[1] ))
+        self._updateMoments(old, new)
+        
+        vert = np.insert(self.Vertices[:-1].astype(float, copy=False), i, point, axis=0)
+        self._setVertices(vert, lambda values: np.insert(values, i, 0, axis=0))
+        self._updateEdges([(i-1) % (n+1), i], [(i-1) % (n+1), i, (i+1) % (n+1)])
+    
+    def deleteVertex(self, i):
+        """
+        deletes vertex i, calculated properties are updated
+        from the terms of the two edges at the vertex (arrays are copied once)
+        """
+        n = len(self.Vertices) - 1
+        if n <= 3:
+            raise ValueError('polygon needs at least 3 vertices')
+        i %= n
+        old = self.Vertices[[(i-1) % n, i, (i+1) % n]]
+        self._updateMoments(old, old[[0,2]])
+        
+        vert = np.delete(self.Vertices[:-1], i, axis=0)
+        self._setVertices(vert, lambda values: np.delete(values, i, axis=0))
+        self._updateEdges([(i-1) % (n-1)], [(i-1) % (n-1), i % (n-1)])
+    
+    def _ownVertices(self):
+        """vertices, copied before first edit (may be shared, e.g. fromClosedArray or integers)"""
+        if not self._OwnVertices:
+            self.Vertices = self.Vertices.astype(float)
+            self._OwnVertices = True
+        return self.Vertices
+    
+    def _setVertices(self, vert, resize):
+        """
+        new vertices (not closed), arrays of edges & vertices are resized,
+        class is selected by new number of vertices
+        """
+        self.Vertices = np.vstack(( vert, vert[:1] )).astype(float, copy=False)
+        self._OwnVertices = True
+        for name in ('EdgesLength', 'EdgesMiddle', 'Angles'):
+            values = self._cached(name)
+            if values is not None:
+                setattr(self, name, resize(values))
+        self.__class__ = polygon._specialized(len(vert), self._axis)
+    
+    def _updateMoments(self, old, new):
+        """
+        area, first & second moments of area are updated by the difference
+        of the terms of the edges of the paths old and new (replaced by new),
+        other properties are recalculated on next access
+        """
+        terms = [self._edgeMoments(path[:-1], path[1:]) for path in (old, new)]
+        dArea, dMoment, dIyyIxx, dIxy = (after - before for before, after in zip(*terms))
+        
+        # values of old vertices needed for the update (calculated once, if not cached),
+        # the centroid is derived from the first moment (also if the area passes zero)
+        SecondMomentArea = self._cached('SecondMomentArea')
+        moment     = any(self._cached(name) is not None for name in ('_MomentSigned', self._Centroid))
+        AreaSigned = self._AreaSigned if moment or SecondMomentArea is not None else self._cached('_AreaSigned')
+        MomentSigned = self._MomentSigned if moment else None
+        Ixy        = self._Ixy    if SecondMomentArea is not None else self._cached('_Ixy')
+        IyyIxx     = self._IyyIxx if SecondMomentArea is not None else self._cached('_IyyIxx')
+        
+        self._clear(('_AreaSigned', '_MomentSigned', self._Centroid, 'SecondMomentArea', '_Ixy', '_IyyIxx', 'Triangles',
+                     'CenterOuterCircle', 'RadiusOuterCircle', 'CenterInnerCircle', 'RadiusInnerCircle',
+                     'CenterMass', 'RotationVolume', 'RotationSurfaces', 'MassMomentInertia'))
+        self._Index   = None
+        self._Queries = 0
+        
+        if AreaSigned is not None:
+            self._AreaSigned = AreaSigned + dArea
+        if MomentSigned is not None:
+            self._MomentSigned = MomentSigned + dMoment
+        if Ixy is not None:
+            self._Ixy = Ixy + dIxy
+        if IyyIxx is not None:
+            self._IyyIxx = IyyIxx + dIyyIxx
+        if SecondMomentArea is not None:
+            self.SecondMomentArea = self._secondMoment(self._IyyIxx, self._Ixy, self.IsClockwise)
+    
+    def _updateEdges(self, edges, vertices):
+        """recalculates lengths & midpoints of edges and angles at vertices, if calculated"""
+        vert = self.Vertices[:-1]
+        n    = len(vert)
+        edges, vertices = np.asarray(edges), np.asarray(vertices)
+        if self._cached('EdgesLength') is not None:
+            self.EdgesLength[edges] = np.linalg.norm(vert[(edges+1) % n] - vert[edges], ord=2, axis=1)
+        if self._cached('EdgesMiddle') is not None:
+            self.EdgesMiddle[edges] = (vert[edges] + vert[(edges+1) % n])/2
+        if self._cached('Angles') is not None:
+            vecIn  = vert[vertices] - vert[(vertices-1) % n]
+            vecOut = vert[(vertices+1) % n] - vert[vertices]
+            self.Angles[vertices] = self._anglesBetween(vecIn, vecOut, np.linalg.norm(vecIn, ord=2, axis=1),
+                                                        np.linalg.norm(vecOut, ord=2, axis=1))
+    
+    def _clear(self, names):
+        """removes calculated values of lazy attributes"""
+        for name in names:
+            if self._cached(name) is not None:
+                delattr(self, '_lazy' + name)
+    
+    # -------------------------------------------------------
+    # boolean operations
+    
+    def union(self, other):
+        """union with polygon other (instance | other), returns polygon"""
+        return self._boolean(other, 'union')
+    
+    def intersection(self, other):
+        """intersection with polygon other (instance & other), returns polygon or None (empty)"""
+        return self._boolean(other, 'intersection')
+    
+    def difference(self, other):
+        """polygon without polygon other, returns polygon or None (empty)"""
+        return self._boolean(other, 'difference')
+    
+    def __or__(self, other):
+        return self.union(other)
+    
+    def __and__(self, other):
+        return self.intersection(other)
+    
+    def _boolean(self, other, operation):
+        """boolean operation by sweep line, see polygon_math.boolean"""
+        from polygon_math.boolean import boolean     # imports polygon module
+        return boolean(self, other, operation)
+    
+    # -------------------------------------------------------
+    # spatial index for point testing
+    
+    def _edgeIndex(self, point):
+        """
+        counts queried points and returns spatial index of edges, which is
+        built after polygon.IndexThreshold queried points (None: never)
+        """
+        if self._Index is None:
+            self._Queries += np.size(point) // 2
+            threshold = polygon.IndexThreshold
+            if threshold is None or self._Queries < threshold or len(self.Vertices) <= self._IndexMinEdges:
+                return None
+            self._Index = _edgeIndex(self.Vertices)
+        return self._Index
+    
     # -------------------------------------------------------
     # methods point testing
     
     @staticmethod
-    def _isPointOnEdge(vert, point):
+    def _edgeLines(vert):
+        """first vertices, normals along, lengths and maximum coordinates of edges"""
+        P1  = vert[:-1]                             # first vertices of edges
+        P12 = vert[1:] - P1                         # Lines from P1 to P2
+        L12 = np.linalg.norm(P12, ord=2, axis=1)    # lengths of P12
+        N   = P12 / np.where(L12 > 0, L12, 1)[:,None]   # Normals along P12 (zero for degenerated edges)
+        edgeMax = np.maximum(np.abs(P1), np.abs(vert[1:])).max(axis=1)
+        return P1, N, L12, edgeMax
+    
+    @staticmethod
+    def _onLine(P1, N, L12, edgeMax, px, py, pointMax):
+        """
+        elementwise (broadcasting) test if points are on edges
+        returns Boolean, vector from P1 to Q and projection on the line
         """
-        computes the distance of a point from each edge. The point is on an 
+        PQx = px - P1[...,0]                        # Lines from P1 to Q
+        PQy = py - P1[...,1]
+        L    = PQx*N[...,0] + PQy*N[...,1]          # Projection of the vector from P1 to Q on the line
+        Dist = np.abs(N[...,0]*PQy - N[...,1]*PQx)  # Norm of distance vector
+        Dist = np.where(L12 > 0, Dist, np.hypot(PQx, PQy))
+        Limit = np.spacing(np.maximum(edgeMax, pointMax))*10    # Consider rounding errors
+        on    = (Dist < Limit) & (L >= 0.0) & (L <= L12)        # Consider end points
+        return on, PQx, PQy, L
+    
+    @staticmethod
+    def _edgeDistance(vert, point, signed = False):
+        """
+        computes the distance of points from each edge. A point is on an 
         edge, if the point is between the vertices and the distance is smaller
         than the rounding error.
         https://de.mathworks.com/matlabcentral/answers/351581-points-lying-within-line
+        point: [x,y] or array of points [[x0,y0],[x1,y1],...]
+        returns for each point: on any edge, index of nearest edge, distance to nearest edge
+        signed: negative distance inside of polygon, crossings counted in the 
+        same pass (see _isPointInside)
+        points are processed in chunks to limit memory (points x edges)
         """
-        for i in range(vert.shape[0] - 1):  # for each edge
-            PQ    =      point - vert[i,]   # Line from P1 to Q
-            P12   = vert[i+1,] - vert[i,]   # Line from P1 to P2
-            L12   = np.sqrt(np.dot(P12,P12))# length of P12
-            N     = P12/L12                 # Normal along P12
-            Dist  = abs(np.cross(N,PQ))     # Norm of distance vector
-            # Consider rounding errors
-            Limit = np.spacing( np.max(np.abs([vert[i,], vert[i+1,], point])) )*10
-            on    = Dist < Limit
-            if on:
-                L = np.dot(PQ,N)            # Projection of the vector from P1 to Q on the line:
-                on = (L>=0.0 and L<=L12)    # Consider end points  
-                return on
-        return on
+        points = np.asarray(point, dtype=float).reshape(-1, 2)
+        P1, N, L12, edgeMax = _polygonBase._edgeLines(vert)
+        pointMax = np.abs(points).max(axis=1)
+        
+        onEdge   = np.zeros(len(points), dtype=bool)
+        index    = np.zeros(len(points), dtype=int)
+        distance = np.zeros(len(points))
+        chunk = max(1, _polygonBase._ChunkSize // len(P1))
+        for k in range(0, len(points), chunk):
+            px, py = points[k:k+chunk, 0, None], points[k:k+chunk, 1, None]
+            on, PQx, PQy, L = _polygonBase._onLine(P1, N, L12, edgeMax, px, py, pointMax[k:k+chunk, None])
+            # distance to closest point of edge
+            t = np.clip(L, 0, L12)
+            D = np.hypot(PQx - t*N[:,0], PQy - t*N[:,1])
+            rows = np.arange(len(D))
+            onEdge[k:k+chunk] = on.any(axis=1)
+            index[k:k+chunk]  = np.where(onEdge[k:k+chunk], on.argmax(axis=1), D.argmin(axis=1))
+            distance[k:k+chunk] = np.where(onEdge[k:k+chunk], 0.0, D[rows, index[k:k+chunk]])
+            if signed:
+                # edges parallel to x-axis never cross the line (between is false)
+                odd = np.count_nonzero(_polygonBase._crosses(vert[:-1], vert[1:], px, py), axis=1) % 2 == 1
+                distance[k:k+chunk] = np.where(odd & ~onEdge[k:k+chunk], -distance[k:k+chunk], distance[k:k+chunk])
+        
+        return onEdge, index, distance
+    
+    @staticmethod
+    def _isPointOnEdge(vert, point):
+        """true, if point is on any edge of polygon"""
+        onEdge = _polygonBase._edgeDistance(vert, point)[0]
+        if np.ndim(point) == 1:
+            return bool(onEdge[0])
+        return onEdge
     
     def isPointOnEdge(self, point):
-        """returns Boolean"""
+        """returns Boolean, or Boolean array for array of points"""
+        index = self._edgeIndex(point)
+        if index is not None:
+            return index.isPointOnEdge(point)
         return self._isPointOnEdge(self.Vertices, point)
     
+    def distanceEdges(self, point):
+        """
+        returns Boolean (on any edge), index of nearest edge and distance to 
+        nearest edge (negative inside of polygon), or arrays for array of points
+        """
+        onEdge, index, distance = self._edgeDistance(self.Vertices, point, signed=True)
+        if np.ndim(point) == 1:
+            return bool(onEdge[0]), int(index[0]), float(distance[0])
+        return onEdge, index, distance
+    
+    
+    @staticmethod
+    def _crosses(vj, vi, px, py):
+        """
+        elementwise (broadcasting) test if line from point in positive 
+        x-direction crosses edges from vj to vi (not parallel to x-axis)
+        """
+        # point between y-coordinates of edge
+        between = (vi[...,1] > py) != (vj[...,1] > py)
+        # x-coordinate of intersection
+        with np.errstate(invalid='ignore', divide='ignore'):
+            Qx = (vj[...,0]-vi[...,0])*(py-vi[...,1])/(vj[...,1]-vi[...,1]) + vi[...,0]
+        # point left of edge --> line crosses edge
+        return between & (px < Qx)
     
     @staticmethod
     def _isPointInside(vert, point = [0,0]):
@@ -379,47 +1006,250 @@ class _polygonBase():
         the polygon an odd number of times.
         Here, the line goes parallel to the x-axis in positive x-direction.
         adapted from https://www.algorithms-and-technologies.com/point_in_polygon/python
+        point: [x,y] or array of points [[x0,y0],[x1,y1],...]
+        points are processed in chunks to limit memory (points x edges)
         """
-        odd = False    
-        for j in range(vert.shape[0]-1):    # for each edge check if the line crosses
-            i = j + 1                       # next vertex
-            # edge parallel to x-axis (singularity)
-            if vert[j,1] == vert[i,1]:
-                continue
-            # point not between y-coordinates of edge
-            if (vert[i,1] > point[1]) == (vert[j,1] > point[1]):
-                continue
-            # x-coordinate of intersection
-            Qx = (vert[j,0]-vert[i,0])*(point[1]-vert[i,1])/(vert[j,1]-vert[i,1]) + vert[i,0]
-            if point[0] < Qx:       # point left of edge
-                odd = not odd       # line crosses edge
+        points = np.asarray(point, dtype=float)
+        single = points.ndim == 1
+        points = points.reshape(-1, 2)
+        
+        # edges parallel to x-axis (singularity) never cross the line
+        vj = vert[:-1]                  # vertex
+        vi = vert[1:]                   # next vertex
+        notParallel = vj[:,1] != vi[:,1]
+        vj = vj[notParallel]
+        vi = vi[notParallel]
+        
+        odd = np.zeros(len(points), dtype=bool)
+        chunk = max(1, _polygonBase._ChunkSize // max(1, len(vj)))
+        for k in range(0, len(points), chunk):
+            crosses = _polygonBase._crosses(vj, vi, points[k:k+chunk, 0, None], points[k:k+chunk, 1, None])
+            odd[k:k+chunk] = np.count_nonzero(crosses, axis=1) % 2 == 1
+        
+        if single:
+            return bool(odd[0])
         return odd  # point is in polygon (not on the edge) if odd=true
     
     def isPointInside(self, point = [0,0]):
-        """returns Boolean"""
+        """returns Boolean, or Boolean array for array of points"""
+        index = self._edgeIndex(point)
+        if index is not None:
+            return index.isPointInside(point)
         return self._isPointInside(self.Vertices, point = point)
+    
+    def selfIntersections(self):
+        """
+        pairs of indices [[e0,e1],...] of intersecting edges (sweep line), empty if polygon is simple,
+        edges touching at common vertices and edges passed in both directions
+        (connections of rings, see fromRings) are not counted,
+        time grows with the pairs of overlapping bounding boxes of edges, up to O(n^2) for jagged outlines
+        """
+        return _selfIntersections(self.Vertices)
+    
+    def rasterize(self, shape, extent = None, coverage = False, samples = 4):
+        """
+        pixel mask (H, W) of inside of polygon (scanlines, same even-odd rule as isPointInside),
+        extent (xmin, xmax, ymin, ymax) default bounding box, row 0 at ymin,
+        coverage: fraction of pixel inside (samples x samples per pixel) instead of Boolean
+        """
+        return rasterize(self.Vertices, shape, extent, coverage, samples)
     def __call__(self, point=[0,0]):
         """returns True, if point [x,y] is inside of polygon (not on the edge)"""
         return self.isPointInside(point)
 
+# #############################################################################
+# transformation class
+# #############################################################################
+
+class _transformation():
+    """
+    lazy affine transformation of polygon, methods are the same as for 
+    manipulation of polygon, but only update the transformation matrix
+    """
+    
+    def __init__(self, polygon_object, Matrix = None):
+        self._polygon = polygon_object
+        self.Matrix   = np.eye(3) if Matrix is None else Matrix     # homogeneous coordinates
+    
+    def __repr__(self):
+        return f'transformation of {self._polygon}, matrix\n{self.Matrix}'
+    
+    def _then(self, A, b = (0,0)):
+        """appends transformation r' = A r + b"""
+        M = np.eye(3)
+        M[:2,:2] = A
+        M[:2,2]  = b
+        return _transformation(self._polygon, M @ self.Matrix)
+    
+    def _then_wrt(self, A, point):
+        """appends transformation with respect to point (default center of mass)"""
+        if point is None:
+            point = self._centerMass()
+        point = np.asarray(point, dtype=float)
+        return self._then(A, point - A @ point)
+    
+    def _centerMass(self):
+        """center of mass of transformed polygon"""
+        if isinstance(self._polygon, _solid):   # not affine for solids of revolution
+            return self.apply().CenterMass
+        return self.Matrix[:2,:2] @ self._polygon.CenterMass + self.Matrix[:2,2]
+    
+    def apply(self):
+        """creates transformed copy of polygon"""
+        M = self.Matrix
+        Vertices_new = self._polygon.Vertices @ M[:2,:2].T + M[:2,2]
+        return self._polygon._affine(M, Vertices_new)
+    
+    # translation
+    def move(self, distances):
+        return self._then(np.eye(2), distances)
+    def centerOrigin(self):
+        return self.move(- self._centerMass())
+    def __add__(self, distances):
+        return self.move(distances)
+    def __sub__(self, distances):
+        return self.move(- np.array(distances))
+    
+    # rotation (wrt to point, default center of mass)
+    def rotate(self, angle, point = None):
+        alpha = np.radians(angle)
+        R = [[np.cos(alpha), -np.sin(alpha)], [np.sin(alpha), np.cos(alpha)]]
+        return self._then_wrt(np.array(R), point)
+    def rotateClockwise(self, angle, point = None):
+        return self.rotate(-angle, point)
+    
+    # scaling (wrt to point, default center of mass)
+    def scale(self, factors, point = None):
+        return self._then_wrt(np.diag(np.ones(2)*factors), point)
+    def __mul__(self, factors):
+        return self.scale(factors)
+    def __truediv__(self, factors):
+        return self.scale( 1/np.array(factors) )
+
+# #############################################################################
+# spatial index class
+# #############################################################################
+
+class _edgeIndex():
+    """
+    uniform grid of buckets in y-direction (slabs), each bucket holds the edges 
+    overlapping its y-range (widened by one bucket for rounding errors).
+    Point tests only evaluate the edges in the bucket of each point.
+    """
+    
+    # average number of buckets overlapped by each edge
+    _EdgesPerBucket = 4
+    
+    def __init__(self, vert):
+        self.Vertices = vert
+        self._lines   = _polygonBase._edgeLines(vert)
+        
+        # number and height of buckets
+        ymin = np.minimum(vert[:-1,1], vert[1:,1])
+        ymax = np.maximum(vert[:-1,1], vert[1:,1])
+        self._y0 = ymin.min()
+        height   = ymax.max() - self._y0
+        if height == 0:
+            height = 1
+        Nedges  = len(ymin)
+        spans   = max(np.sum(ymax - ymin) / height, 1/Nedges)   # sum of edge heights / polygon height
+        self._Nbuckets = int(np.clip(self._EdgesPerBucket * Nedges / spans, 1, Nedges))
+        self._h = height / self._Nbuckets
+        
+        # buckets overlapped by edges (compressed sparse rows)
+        first  = np.clip(self._bucket(ymin) - 1, 0, self._Nbuckets-1)
+        last   = np.clip(self._bucket(ymax) + 1, 0, self._Nbuckets-1)
+        counts = last - first + 1
+        edges   = np.repeat(np.arange(Nedges), counts)
+        buckets = np.repeat(first, counts) + self._ramp(counts)
+        order = np.argsort(buckets, kind='stable')
+        self._edges   = edges[order]
+        self._offsets = np.append(0, np.cumsum(np.bincount(buckets, minlength=self._Nbuckets)))
+    
+    def _bucket(self, y):
+        return np.floor((y - self._y0) / self._h).astype(int)
+    
+    @staticmethod
+    def _ramp(counts):
+        """0,1,..,counts[0]-1, 0,1,..,counts[1]-1, ..."""
+        total = np.sum(counts)
+        return np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    
+    def _pairs(self, points):
+        """indices of points and candidate edges"""
+        b = np.clip(self._bucket(points[:,1]), 0, self._Nbuckets-1)
+        counts = self._offsets[b+1] - self._offsets[b]
+        ipoint = np.repeat(np.arange(len(points)), counts)
+        iedge  = self._edges[np.repeat(self._offsets[b], counts) + self._ramp(counts)]
+        return ipoint, iedge
+    
+    def _chunks(self, point):
+        """chunks of points with bounded number of point-edge combinations"""
+        points = np.asarray(point, dtype=float).reshape(-1, 2)
+        chunk  = max(1, _polygonBase._ChunkSize * self._Nbuckets // len(self._edges))
+        for k in range(0, len(points), chunk):
+            yield k, points[k:k+chunk]
+    
+    def isPointInside(self, point):
+        """same crossing test as _polygonBase._isPointInside"""
+        vert = self.Vertices
+        odd  = np.zeros(len(np.reshape(point, (-1, 2))), dtype=bool)
+        for k, points in self._chunks(point):
+            ipoint, iedge = self._pairs(points)
+            vj = vert[iedge]
+            vi = vert[iedge+1]
+            notParallel = vj[:,1] != vi[:,1]
+            ipoint, vj, vi = ipoint[notParallel], vj[notParallel], vi[notParallel]
+            crosses = _polygonBase._crosses(vj, vi, points[ipoint,0], points[ipoint,1])
+            odd[k:k+len(points)] = np.bincount(ipoint[crosses], minlength=len(points)) % 2 == 1
+        if np.ndim(point) == 1:
+            return bool(odd[0])
+        return odd
+    
+    def isPointOnEdge(self, point):
+        """same test as _polygonBase._isPointOnEdge"""
+        P1, N, L12, edgeMax = self._lines
+        onEdge = np.zeros(len(np.reshape(point, (-1, 2))), dtype=bool)
+        for k, points in self._chunks(point):
+            ipoint, iedge = self._pairs(points)
+            q = points[ipoint]
+            on = _polygonBase._onLine(P1[iedge], N[iedge], L12[iedge], edgeMax[iedge],
+                                      q[:,0], q[:,1], np.abs(q).max(axis=1))[0]
+            onEdge[k:k+len(points)] = np.bincount(ipoint[on], minlength=len(points)) > 0
+        if np.ndim(point) == 1:
+            return bool(onEdge[0])
+        return onEdge
+
 # #############################################################################
 # triangle class
 # #############################################################################
 
 class _triangle(_polygonBase):
     
+    __slots__ = ()
+    
     # -------------------------------------------------------
-    # constructor (geometrical properties)
+    # geometrical properties of the triangle (calculated on first access)
     
-    def __init__(self, vert, axis):
-        """calculates geometrical properties of triangle"""
-        super().__init__(vert, axis)
+    @_lazy
+    def CenterOuterCircle(self):
+        """circumcenter / center of circumsribed (outer) circle"""
+        return self._OuterCircle(self.Vertices)[0]
     
-        self.CenterOuterCircle, self.RadiusOuterCircle = self._OuterCircle(vert)
-        self.CenterInnerCircle, self.RadiusInnerCircle = self._incircle(vert, self.Area, self.EdgesLength)
+    @_lazy
+    def RadiusOuterCircle(self):
+        """radius of circumsribed (outer) circle"""
+        return self._OuterCircle(self.Vertices)[1]
     
-    # -------------------------------------------------------
-    # geometrical properties of the triangle
+    @_lazy
+    def CenterInnerCircle(self):
+        """center of incircle (inner circle)"""
+        return self._incircle(self.Vertices, self.Area, self.EdgesLength)[0]
+    
+    @_lazy
+    def RadiusInnerCircle(self):
+        """radius of incircle (inner circle)"""
+        return self._incircle(self.Vertices, self.Area, self.EdgesLength)[1]
     
     @staticmethod
     def _incircle(vert, Area, EdgesLength):
@@ -465,36 +1295,90 @@ class _triangle(_polygonBase):
 
 class _solid(_polygonBase):
     
+    __slots__ = ()
+    
+    # name of centroid of area (CenterMass relates to solid)
+    _Centroid = 'CenterMassCrossSection'
+    
     # -------------------------------------------------------
-    # constructor (geometrical properties)
+    # constructor (geometrical properties calculated on first access)
     
     def __init__(self, vert, axis):
-        """calculates geometrical properties of solid of revolution"""
         super().__init__(vert, axis)
     
         if min(vert[:,1-axis]) * max(vert[:,1-axis]) < 0:
             warnings.warn('solid of revolution self-intersecting (axis of rotation intersects cross-section)')
-        
-        self.RotationVolume, self.CenterMass, self.CenterMassCrossSection = self._geom3D(axis, self._AreaSigned, self.CenterMass, self._Ixy)
-        self.RotationSurfaces = self._surfaces(axis, self.EdgesLength, self.EdgesMiddle)
     
     # -------------------------------------------------------
     # geometrical properties of the solid
     
+    @_lazy
+    def CenterMassCrossSection(self):
+        """centroid of cross-section [r,z]"""
+        return self._MomentSigned / self._AreaSigned
+    
+    @_lazy
+    def RotationVolume(self):
+        return self._geom3D(self._axis, self._AreaSigned, self.CenterMassCrossSection, self._Ixy)[0]
+    
+    @_lazy
+    def CenterMass(self):
+        """center of mass of solid"""
+        return self._geom3D(self._axis, self._AreaSigned, self.CenterMassCrossSection, self._Ixy)[1]
+    
+    @_lazy
+    def RotationSurfaces(self):
+        """surface areas of edges"""
+        return self._surfaces(self._axis, self.EdgesLength, self.EdgesMiddle)
+    
+    @_lazy
+    def MassMomentInertia(self):
+        """mass moments of inertia [polar, transverse] for density 1, transverse axis through center of mass"""
+        return self._inertia(self._axis, self.Vertices, self.RotationVolume, self.CenterMass)
+    
     @staticmethod
-    def _geom3D(axis, _AreaSigned, CenterMass, _Ixy):
+    def _geom3D(axis, _AreaSigned, CenterMassCrossSection, _Ixy):
         """calculates volume and 3D center of mass"""
         # Pappus's centroid theorem
         # https://en.wikipedia.org/wiki/Pappus%27s_centroid_theorem
-        RotationVolumeSigned = 2*np.pi * _AreaSigned * CenterMass[1-axis]
+        RotationVolumeSigned = 2*np.pi * _AreaSigned * CenterMassCrossSection[1-axis]
         
         # center of mass (in polar coordinates related to product of inertia)
         zS = 2*np.pi * _Ixy / RotationVolumeSigned
-        CenterMass, CenterMassCrossSection = [0, zS] , CenterMass
+        CenterMass = [0, zS]
         if axis == 0:
             CenterMass = CenterMass[::-1]
         
-        return abs(RotationVolumeSigned), CenterMass, CenterMassCrossSection
+        return abs(RotationVolumeSigned), CenterMass
+    
+    @staticmethod
+    def _inertia(axis, vert, RotationVolume, CenterMass, Offsets = None):
+        """
+        calculates mass moments of inertia, polar: 2*pi * integral r^3 dA,
+        transverse (origin): pi * integral r^3 dA + 2*pi * integral r*z^2 dA,
+        Offsets: optional, rows of polygons of collection (see _polygonBase._edgeMoments)
+        """
+        rz = vert[:,[1-axis, axis]]
+        Ir3, Irz2 = _solid._edgeInertia(rz[:-1], rz[1:], Offsets)
+        
+        # parallel axis theorem for transverse axis through center of mass
+        polar      = abs(2*np.pi * Ir3)
+        transverse = abs(np.pi * Ir3 + 2*np.pi * Irz2) - RotationVolume * np.asarray(CenterMass)[...,axis]**2
+        return np.stack(( polar, transverse ), axis=-1)
+    
+    @staticmethod
+    def _edgeInertia(rzi, rzip1, Offsets = None):
+        """
+        integrals of r^3 and r*z^2 over cross-section as sums of the terms of the
+        edges rzi -> rzip1 ([r,z], Green's theorem), Offsets see _polygonBase._edgeMoments
+        """
+        (ri, zi), (rip1, zip1) = rzi.T, rzip1.T
+        FM = ri*zip1 - rip1*zi
+        if Offsets is not None:
+            FM[Offsets[1:-1]-1] = 0
+        Ir3  = _polygonBase._edgeSum(FM, ri**3 + ri**2*rip1 + ri*rip1**2 + rip1**3, Offsets) / 20
+        Irz2 = _polygonBase._edgeSum(FM, ri*(3*zi**2 + 2*zi*zip1 + zip1**2) + rip1*(zi**2 + 2*zi*zip1 + 3*zip1**2), Offsets) / 60
+        return Ir3, Irz2
     
     
     @staticmethod
@@ -515,39 +1399,65 @@ class _solid(_polygonBase):
         """returns volume"""
         return self.RotationVolume
     
+    # -------------------------------------------------------
+    # methods mesh export
+    
+    def surfaceMesh(self, Nangle = 64):
+        """
+        triangulated surface of solid, axis of rotation is z-axis (as in plot3d)
+        Nangle: optional, number of points per circle
+        returns Points[p,xyz], Triangles[k,:] (indices of points, normals outwards)
+        """
+        return revolve(self.Vertices, self._axis, Nangle)
+    
+    def exportMesh(self, filename, Nangle = 64):
+        """writes triangulated surface (see surfaceMesh) as binary STL (.stl) or OBJ (.obj) file"""
+        writeMesh(filename, *self.surfaceMesh(Nangle))
+    
     # -------------------------------------------------------
     # methods plotting
     
-    def plot3d(self, *plt_args, Ncross = 8, Nedge = 0, ax = None, **plt_kwargs):
+    def plot3d(self, *plt_args, Ncross = 8, Nedge = 0, Npoints = 50, ax = None, **plt_kwargs):
         """
-        3D wireframe plot of solid 
-        Ncross: optional, number of cross-sections
-        Nedge:  optional, number of circles per edge
+        3D wireframe plot of solid (single line, see wireframe)
+        Ncross:  optional, number of cross-sections
+        Nedge:   optional, number of circles per edge
+        Npoints: optional, number of points per circle
         """
-        vert = copy.copy(self.Vertices)
-        if self._axis == 0:
-            vert = vert[:, ::-1]    # x & y switched --> tilted 90°
         if ax is None:
-            ax = plt.axes(projection='3d')
-        # single label for 3D wireframe
-        if 'label' in plt_kwargs:
-            label = plt_kwargs.pop('label')
-            ax.plot([],[], *plt_args, label=label, **plt_kwargs)
-        # plot cross-sections
-        for angle in np.linspace(0, 2*np.pi, Ncross+1):
-            ax.plot(vert[:,0]*np.cos(angle), vert[:,0]*np.sin(angle), vert[:,1], *plt_args, **plt_kwargs)
-        # plot circumferential edges
-        for i in range(len(vert)-1):
-            coord = np.linspace( vert[i,:], vert[i+1,:], Nedge+1, endpoint=False )
-            for point in coord:
-                self._plot_circ(*plt_args, radius = point[0], center = (0, 0, point[1] ), **plt_kwargs )
+            ax = _pyplot().axes(projection='3d')
+        ax.plot(*self.wireframe(Ncross, Nedge, Npoints), *plt_args, **plt_kwargs)
         return ax
     
+    def wireframe(self, Ncross = 8, Nedge = 0, Npoints = 50):
+        """
+        coordinates x, y, z of 3D wireframe of solid, lines separated by NaN
+        (cross-sections and circles at Nedge+1 points of each edge)
+        """
+        vert = self.Vertices
+        if self._axis == 0:
+            vert = vert[:, ::-1]    # x & y switched --> tilted 90°
+        radius, height = vert[:,0], vert[:,1]
+        
+        # cross-sections [section, vertex]
+        angle  = np.linspace(0, 2*np.pi, Ncross, endpoint=False)[:,None]
+        lines  = [( radius*np.cos(angle), radius*np.sin(angle), np.broadcast_to(height, (Ncross, len(vert))) )]
+        
+        # circumferential circles [circle, point], at vertices and points on edges
+        t      = np.arange(Nedge+1)[None,:,None] / (Nedge+1)
+        points = (vert[:-1,None,:] + t*(vert[1:] - vert[:-1])[:,None,:]).reshape(-1,2)
+        angle  = np.linspace(0, 2*np.pi, Npoints+1)
+        lines += [( points[:,:1]*np.cos(angle), points[:,:1]*np.sin(angle), np.repeat(points[:,1:], Npoints+1, axis=1) )]
+        
+        # NaN after each line
+        return tuple( np.concatenate([ np.hstack(( line[k], np.full((len(line[k]),1), np.nan) )).ravel() for line in lines ])
+                      for k in range(3) )
+    
     
     def plotRotationAxis(self, color = 'k', linestyle = '-.', ax = None, **plt_kwargs):
         """only keyword arguments"""
         if ax is None:
-            ax = plt.gca()
+            ax = _pyplot().gca()
         if ax.name == "3d":
             ax.plot([0,0], [0,0], [ax.get_zlim()[0], ax.get_zlim()[1]], 
                     color = color, linestyle = linestyle, **plt_kwargs )
@@ -561,7 +1471,7 @@ class _solid(_polygonBase):
     def plotCenterMassCrossSection(self, *plt_args, ax = None, **plt_kwargs):
         """for 2D plot"""
         if ax is None:
-            ax = plt.gca()
+            ax = _pyplot().gca()
         if not plt_args:
             if 'color' not in plt_kwargs:
                 plt_kwargs['color']  = 'g'
@@ -575,6 +1485,7 @@ class _solid(_polygonBase):
 # #############################################################################
 
 class _solid_and_triangle(_triangle, _solid):
+    __slots__ = ()
     def __init__(self, vert, axis):
         """calculates geometrical properties of solid of revolution"""
         super().__init__(vert, axis)
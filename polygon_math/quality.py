@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from polygon_math.triangles import triangleCollection
+
+# #############################################################################
+# mesh quality
+# #############################################################################
+
+def meshQuality(Vertices, Triangles = None, bins = 20, worst = 10, maxAspectRatio = 10, chunksize = 2**18):
+    """
+    quality statistics of triangles (e.g. elements of FE meshes), calculated in chunks
+    (memory maps are only read chunk by chunk)
+    
+    Vertices:       vertices of triangles, array of shape (N,3,2),
+                    or coordinates of nodes of mesh Points[p,xy], if Triangles are given
+    Triangles:      optional, indices of nodes of triangles [k,i], e.g. polygon.Triangles
+    bins:           number of bins of histograms
+    worst:          number of worst triangles (smallest radius ratio)
+    maxAspectRatio: upper limit of histogram of aspect ratio (larger values in last bin)
+    chunksize:      number of triangles evaluated at once
+    
+    quality measures (1 for equilateral triangle, degenerated triangles: radius ratio 0):
+        - RadiusRatio = 2 * RadiusInnerCircle / RadiusOuterCircle    range 0 ... 1
+        - MinAngle    = smallest inner angle / 60°                   range 0 ... 1
+        - AspectRatio = longest edge / (2*sqrt(3) * RadiusInnerCircle) range 1 ... inf
+    
+    returns dictionary:
+        - Triangles:                   number of triangles
+        - RadiusRatio, MinAngle, AspectRatio: histograms (counts, edges of bins)
+        - Worst:                       indices of worst triangles (worst first)
+        - WorstRadiusRatio:            radius ratio of worst triangles
+    """
+    if Triangles is None:
+        N = len(Vertices)
+    else:
+        N = len(Triangles)
+        Points = np.asarray(Vertices, dtype=float)
+    
+    edges = {'RadiusRatio': np.linspace(0, 1, bins+1),
+             'MinAngle':    np.linspace(0, 1, bins+1),
+             'AspectRatio': np.linspace(1, maxAspectRatio, bins+1)}
+    counts = {name: np.zeros(bins, dtype=np.int64) for name in edges}
+    WorstIndex = np.zeros(0, dtype=np.int64)
+    WorstValue = np.zeros(0)
+    
+    for start in range(0, N, chunksize):
+        if Triangles is None:
+            vert = np.asarray(Vertices[start:start+chunksize], dtype=float)
+        else:
+            vert = Points[np.asarray(Triangles[start:start+chunksize])]
+        measures = _quality(vert)
+        
+        for name in counts:     # values out of range (e.g. rounding) in first / last bin
+            values = np.clip(measures[name], edges[name][0], edges[name][-1])
+            counts[name] += np.histogram(values, edges[name])[0]
+        
+        # worst triangles of chunk and worst triangles so far (no full sort)
+        WorstIndex = np.append(WorstIndex, start + np.arange(len(vert)))
+        WorstValue = np.append(WorstValue, measures['RadiusRatio'])
+        if len(WorstValue) > worst:
+            keep = np.argpartition(WorstValue, worst)[:worst]
+            WorstIndex, WorstValue = WorstIndex[keep], WorstValue[keep]
+    
+    order = np.lexsort((WorstIndex, WorstValue))
+    result = {'Triangles': N, 'Worst': WorstIndex[order], 'WorstRadiusRatio': WorstValue[order]}
+    for name in counts:
+        result[name] = (counts[name], edges[name])
+    return result
+
+
+def _quality(vert):
+    """radius ratio, minimum angle and aspect ratio of triangles, see meshQuality"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        AreaSigned, EdgesLength, Angles = triangleCollection._geom(vert)
+        RadiusOuterCircle = triangleCollection._outerCircles(vert)[1]
+        RadiusInnerCircle = triangleCollection._incircles(vert, abs(AreaSigned), EdgesLength)[1]
+        RadiusRatio = 2*RadiusInnerCircle / RadiusOuterCircle
+        AspectRatio = EdgesLength.max(axis=1) / (2*np.sqrt(3)*RadiusInnerCircle)
+    # degenerated triangles: radius ratio 0, aspect ratio inf (0/0 and x/0)
+    RadiusRatio = np.where(np.isfinite(RadiusRatio), RadiusRatio, 0)
+    AspectRatio = np.where(np.isnan(AspectRatio), np.inf, AspectRatio)
+    MinAngle = np.nan_to_num(Angles.min(axis=1) / 60)
+    
+    return {'RadiusRatio': RadiusRatio, 'MinAngle': MinAngle, 'AspectRatio': AspectRatio}
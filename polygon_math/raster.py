@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# #############################################################################
+# rasterization of polygons (scanlines)
+# #############################################################################
+
+def rasterize(vert, shape, extent = None, coverage = False, samples = 4, chunksize = 2**22):
+    """
+    pixel mask of inside of closed polygon (even-odd rule, see polygon.isPointInside)
+    
+    shape:     (H, W) number of pixels in y- and x-direction
+    extent:    optional, (xmin, xmax, ymin, ymax) of mask (default bounding box of vertices),
+               row 0 at ymin (matplotlib: imshow(mask, origin='lower', extent=extent))
+    coverage:  optional, fraction of pixel inside of polygon (samples x samples per pixel)
+               instead of Boolean test of center of pixel
+    chunksize: number of pixels (of supersampled mask) rasterized at once
+    
+    For each scanline (y-coordinate of pixel centers), the x-coordinates of the
+    crossings with the edges are calculated as in _polygonBase._crosses. A pixel
+    is inside, if an odd number of crossings is right of its center.
+    """
+    H, W = shape
+    if extent is None:
+        (xmin, ymin), (xmax, ymax) = vert.min(axis=0), vert.max(axis=0)
+    else:
+        xmin, xmax, ymin, ymax = extent
+    if not coverage:
+        samples = 1
+    xc = _centers(xmin, xmax, W*samples)
+    yc = _centers(ymin, ymax, H*samples)
+    
+    # chunks of rows of pixels (multiple of samples)
+    rows = max(1, chunksize // (W*samples**2)) * samples
+    mask = np.empty((H, W), dtype=float if coverage else bool)
+    for start in range(0, H*samples, rows):
+        inside = _scanlines(vert, xc, yc[start:start+rows])
+        if coverage:
+            inside = inside.reshape(-1, samples, W, samples).mean(axis=(1,3))
+        mask[start//samples:(start+rows)//samples] = inside
+    return mask
+
+
+def _centers(low, high, n):
+    """coordinates of centers of n pixels between low and high"""
+    return low + (np.arange(n) + 0.5) * (high - low) / n
+
+
+def _scanlines(vert, xc, yc):
+    """Boolean mask [row, column] of pixel centers (xc, yc) inside of polygon"""
+    # edges not parallel to x-axis, vj vertex, vi next vertex
+    vj, vi = vert[:-1], vert[1:]
+    notParallel = vj[:,1] != vi[:,1]
+    vj, vi = vj[notParallel], vi[notParallel]
+    
+    # rows between y-coordinates of edges: min <= y < max
+    low  = np.searchsorted(yc, np.minimum(vj[:,1], vi[:,1]), side='left')
+    high = np.searchsorted(yc, np.maximum(vj[:,1], vi[:,1]), side='left')
+    count = high - low
+    edge = np.repeat(np.arange(len(vj)), count)
+    row  = low[edge] + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    
+    # x-coordinate of crossings, number of pixel centers left of crossing
+    vj, vi, py = vj[edge], vi[edge], yc[row]
+    Qx = (vj[:,0]-vi[:,0])*(py-vi[:,1])/(vj[:,1]-vi[:,1]) + vi[:,0]
+    left = np.searchsorted(xc, Qx, side='left')
+    
+    # parity of crossings right of each pixel center (xor from the right)
+    W = len(xc) + 1
+    parity = np.bincount(row*W + left, minlength=len(yc)*W).reshape(len(yc), W) % 2
+    parity = parity.astype(np.uint8)
+    return np.bitwise_xor.accumulate(parity[:,::-1], axis=1)[:,::-1][:,1:].astype(bool)
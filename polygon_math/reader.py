@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import json
+import csv
+import os
+import re
+
+from polygon_math.polygon import polygon, _polygonBase
+from polygon_math.collection import polygonCollection
+
+# #############################################################################
+# streaming reader
+# #############################################################################
+
+def readPolygons(filename, fileformat = None, axis = None, batch = None):
+    """
+    generator of polygons read from file, only one polygon (or batch) is kept in memory
+    
+    filename:   CSV, WKT or GeoJSON file
+    fileformat: optional, 'csv', 'wkt' or 'geojson' (default from file extension)
+    axis:       optional, solids of revolution, see polygon
+    batch:      optional, number of polygons per polygonCollection (property arrays)
+                instead of single polygon objects
+    
+    file formats:
+        - CSV:     one row per vertex: id,x,y (vertices of polygon in consecutive rows)
+                   or one row per polygon: x0,y0,x1,y1,...
+                   a leading header row is skipped, other malformed rows raise ValueError
+        - WKT:     one POLYGON or MULTIPOLYGON per line (Z, M, ZM: only x y are read)
+        - GeoJSON: FeatureCollection, Feature or geometry (Polygon, MultiPolygon),
+                   or one of these per line (newline-delimited GeoJSON)
+    
+    holes get opposite order of vertices than outer contour, see polygon.fromRings
+    """
+    if fileformat is None:
+        fileformat = os.path.splitext(filename)[1].lstrip('.').lower()
+    readers = {'csv': _readCSV, 'wkt': _readWKT, 'txt': _readWKT,
+               'geojson': _readGeoJSON, 'json': _readGeoJSON, 'geojsonl': _readGeoJSON, 'ndjson': _readGeoJSON}
+    if fileformat not in readers:
+        raise ValueError(f'unknown file format: {fileformat}')
+    
+    rings = readers[fileformat](filename)
+    if batch is None:
+        for Rings in rings:
+            yield polygon.fromRings(_orientRings(Rings), axis)
+    else:
+        vert = []
+        for Rings in rings:
+            vert.append(polygon.fromRings(_orientRings(Rings)).Vertices)
+            if len(vert) == batch:
+                yield _collection(vert, axis)
+                vert = []
+        if vert:
+            yield _collection(vert, axis)
+
+
+def _collection(vert, axis):
+    """collection of closed polygons"""
+    Offsets = np.append(0, np.cumsum([len(v) for v in vert]))
+    return polygonCollection.fromArrays(np.concatenate(vert), Offsets, axis)
+
+
+def _orientRings(Rings):
+    """holes with opposite order of vertices than outer contour (first ring)"""
+    rings = [np.asarray(ring, dtype=float) for ring in Rings]
+    outer = np.sign(_polygonBase._area(polygon._inputChecks(rings[0])))
+    for i in range(1, len(rings)):
+        if np.sign(_polygonBase._area(polygon._inputChecks(rings[i]))) == outer:
+            rings[i] = rings[i][::-1]
+    return rings
+
+# #############################################################################
+# file formats, generators of rings of each polygon
+# #############################################################################
+
+def _readCSV(filename):
+    with open(filename, newline='') as file:
+        reader = csv.reader(file)
+        polygonId = None
+        vert = []
+        first = True
+        for row in reader:
+            fields = [value.strip() for value in row if value.strip()]
+            if not fields:
+                continue
+            values = _numbers(fields[1:] if len(fields) == 3 else fields)
+            if values is None and first:    # header
+                first = False
+                continue
+            first = False
+            if values is None:
+                raise ValueError(f'{filename}, line {reader.line_num}: coordinates not numeric: {",".join(row)}')
+            if len(fields) == 3:            # id,x,y (id compared as string)
+                if fields[0] != polygonId and vert:
+                    yield [vert]
+                    vert = []
+                polygonId = fields[0]
+                vert.append(values)
+            elif len(values) >= 6 and len(values) % 2 == 0:    # x0,y0,x1,y1,...
+                yield [np.reshape(values, (-1, 2))]
+            else:
+                raise ValueError(f'{filename}, line {reader.line_num}: {len(values)} values, '
+                                 'expected id,x,y or x0,y0,x1,y1,... (at least 3 vertices)')
+        if vert:
+            yield [vert]
+
+
+def _numbers(fields):
+    """values of fields, None if not numeric"""
+    try:
+        return [float(value) for value in fields]
+    except ValueError:
+        return None
+
+
+# geometry type, dimensions (Z, M, ZM) and rings of WKT line
+_WKT = re.compile(r'(MULTIPOLYGON|POLYGON)\s*([A-Z]*)\s*(.*)', re.DOTALL)
+_WKTDimensions = {'': 2, 'Z': 3, 'M': 3, 'ZM': 4, 'EMPTY': 2}
+
+
+def _readWKT(filename):
+    with open(filename) as file:
+        for line in file:
+            match = _WKT.match(line.strip().upper())
+            if not match:
+                continue
+            kind, tag, text = match.groups()
+            if tag not in _WKTDimensions:
+                raise ValueError(f'unsupported WKT dimensions: {kind} {tag}')
+            if kind == 'POLYGON':
+                text = '(' + text + ')'
+            yield from _parseWKT(text, _WKTDimensions[tag])
+
+
+def _parseWKT(text, dimensions = 2):
+    """rings of polygons from ((( x y, x y, ...), (...)), ((...))), only x y of Z, M, ZM coordinates"""
+    polygons = []
+    depth = 0
+    for i, char in enumerate(text):
+        if char == '(':
+            depth += 1
+            if depth == 2:
+                polygons.append([])
+            elif depth == 3:
+                start = i + 1
+        elif char == ')':
+            if depth == 3:
+                coordinates = text[start:i].replace(',', ' ').split()
+                if len(coordinates) % dimensions:
+                    raise ValueError(f'WKT coordinates do not have {dimensions} dimensions: {text[start:i]}')
+                polygons[-1].append(np.array(coordinates, dtype=float).reshape(-1, dimensions)[:,:2])
+            depth -= 1
+    return [rings for rings in polygons if rings]
+
+
+def _readGeoJSON(filename, chunksize = 2**16, maxsize = 2**28):
+    """
+    streams features of FeatureCollection, or sequence of GeoJSON objects,
+    only the current object is kept in memory and decoded once
+    maxsize: maximum number of characters of a single object
+    """
+    with open(filename) as file:
+        for text in _jsonObjects(file, chunksize, maxsize):
+            yield from _geometryRings(json.loads(text))
+
+
+# tokens for the end of JSON objects (only braces count, arrays are inside of objects)
+_Braces     = re.compile(r'[{}"]')
+_String     = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_Separators = re.compile(r'[ \t\r\n,\x1e]*')
+_Features   = re.compile(r'\s*:\s*\[')
+
+
+def _jsonObjects(file, chunksize, maxsize):
+    """
+    texts of consecutive JSON objects in file (separated by whitespace or commas),
+    if the first object has a features array (FeatureCollection), texts of the features
+    
+    The end of an object is found by the depth of braces outside of strings, each chunk
+    of the file is scanned once (an incomplete string at the end of a chunk is scanned
+    again with the next chunk), the text of the object is joined from its parts.
+    """
+    window = file.read(chunksize)   # current chunk of file
+    pos    = 0                      # scanned up to pos
+    start  = None                   # start of current object in window (None between objects)
+    parts  = []                     # text of current object before window
+    size   = 0
+    depth  = 0
+    first, inFeatures = True, False
+    
+    def more(carry):
+        """next chunk, window[carry:] is scanned again"""
+        nonlocal window, pos, start, size
+        chunk = file.read(chunksize)
+        if not chunk:
+            return False
+        if start is not None:
+            parts.append(window[start:carry])
+            size += carry - start
+            if size + len(window) - carry + len(chunk) > maxsize:
+                raise ValueError(f'GeoJSON object larger than {maxsize} characters')
+            start = 0
+        window, pos = window[carry:] + chunk, 0
+        return True
+    
+    while True:
+        if start is None:
+            # between objects
+            pos = _Separators.match(window, pos).end()
+            if pos == len(window):
+                if more(pos):
+                    continue
+                return
+            if inFeatures and window[pos] == ']':
+                return
+            if window[pos] != '{':
+                raise json.JSONDecodeError('Expecting object', window, pos)
+            start, parts, size, depth = pos, [], 0, 0
+        
+        token = _Braces.search(window, pos)
+        if token is None:
+            if not more(len(window)):
+                raise json.JSONDecodeError('Unterminated object', window, len(window))
+            continue
+        pos = token.start()
+        
+        if token.group() == '"':
+            string = _String.match(window, pos)
+            if string is None:
+                if not more(pos):
+                    raise json.JSONDecodeError('Unterminated string', window, pos)
+                continue
+            if first and depth == 1 and string.group() == '"features"':
+                # decided by following characters (read next chunk, if few left)
+                if len(window) - string.end() < 64 and more(pos):
+                    continue
+                array = _Features.match(window, string.end())
+                if array:
+                    first, inFeatures = False, True
+                    start, pos = None, array.end()
+                    continue
+            pos = string.end()
+        elif token.group() == '{':
+            depth += 1
+            pos += 1
+        else:
+            depth -= 1
+            pos += 1
+            if depth == 0:
+                text = ''.join(parts) + window[start:pos]
+                start, parts, first = None, [], False
+                yield text
+
+
+def _geometryRings(obj):
+    """rings of polygons of GeoJSON object"""
+    kind = obj.get('type')
+    if kind == 'FeatureCollection':
+        for feature in obj.get('features', []):
+            yield from _geometryRings(feature)
+    elif kind == 'Feature':
+        if obj.get('geometry'):
+            yield from _geometryRings(obj['geometry'])
+    elif kind == 'GeometryCollection':
+        for geometry in obj.get('geometries', []):
+            yield from _geometryRings(geometry)
+    elif kind == 'Polygon':
+        yield obj['coordinates']
+    elif kind == 'MultiPolygon':
+        yield from obj['coordinates']
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from polygon_math.triangulation import _rings
+
+# #############################################################################
+# simplification of polygons
+# #############################################################################
+
+def simplifyVertices(vert, tolerance, method = 'douglas-peucker'):
+    """
+    vertices of simplified closed polygon (first = last vertex)
+    vert:      closed polygon
+    tolerance: douglas-peucker: maximum distance of removed vertices to simplified edges
+               visvalingam:     maximum area of triangle of removed vertex and its neighbours
+    repeated vertices (e.g. connections of holes) are kept,
+    each ring (outer contour, hole, see polygon.fromRings) keeps at least 3 vertices
+    """
+    methods = {'douglas-peucker': _douglasPeucker, 'visvalingam': _visvalingam}
+    if method not in methods:
+        raise ValueError(f'unknown method of simplification: {method}')
+    unique = vert[:-1]
+    keep = methods[method](unique, tolerance, _repeated(unique), _ringIds(vert))
+    unique = unique[keep]
+    return np.vstack(( unique, unique[:1] ))
+
+
+def _repeated(vert):
+    """vertices which occur more than once"""
+    _, inverse, counts = np.unique(vert, axis=0, return_inverse=True, return_counts=True)
+    return counts[inverse.ravel()] > 1
+
+
+def _ringIds(vert):
+    """index of ring of each vertex (not closed), -1 for repeated vertices not in a ring"""
+    ids = np.full(len(vert)-1, -1)
+    for k, ring in enumerate(_rings(vert)):
+        ids[ring] = k
+    return ids
+
+
+def _douglasPeucker(vert, tolerance, fixed, rings):
+    """
+    Ramer-Douglas-Peucker algorithm, the chains between kept vertices are split
+    at the vertex farthest from the edge connecting their ends, until all
+    vertices are within tolerance, returns Boolean array of kept vertices
+    https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm
+    """
+    n = len(vert)
+    keep = fixed.copy()
+    # rings with less than 3 kept vertices: first (kept) vertex, vertex farthest
+    # from it and vertex farthest from their connection
+    order = np.argsort(rings, kind='stable')
+    bounds = np.cumsum(np.bincount(rings + 1))
+    for ring in np.split(order, bounds[:-1])[1:]:
+        if np.count_nonzero(keep[ring]) < 3:
+            first = ring[np.argmax(keep[ring])]
+            far   = ring[np.argmax(np.sum((vert[ring] - vert[first])**2, axis=1))]
+            keep[[first, far]] = True
+            keep[ring[np.argmax(_distances(vert[ring], vert[first], vert[far]))]] = True
+    
+    # chains between consecutive kept vertices (last chain wraps around)
+    vertext = np.vstack(( vert, vert ))
+    anchors = np.nonzero(keep)[0]
+    stack = list(zip(anchors, np.append(anchors[1:], anchors[0] + n)))
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        distances = _distances(vertext[a+1:b], vertext[a], vertext[b])
+        k = np.argmax(distances)
+        if distances[k] > tolerance:
+            k += a + 1
+            keep[k % n] = True
+            stack += [(a, k), (k, b)]
+    return keep
+
+
+def _visvalingam(vert, tolerance, fixed, rings):
+    """
+    Visvalingam-Whyatt algorithm, vertices with the smallest area of the triangle with
+    their neighbours are removed until all areas exceed tolerance, in each round all
+    vertices with locally smallest area (not neighbouring) are removed at once
+    (at least 3 vertices per ring), returns Boolean array of kept vertices
+    https://en.wikipedia.org/wiki/Visvalingam%E2%80%93Whyatt_algorithm
+    """
+    keep = np.ones(len(vert), dtype=bool)
+    while np.count_nonzero(keep) > 3:
+        index = np.nonzero(keep)[0]
+        v     = vert[index]
+        prev  = np.roll(v, 1, axis=0) - v
+        next  = np.roll(v, -1, axis=0) - v
+        area  = abs(prev[:,0]*next[:,1] - prev[:,1]*next[:,0])/2
+        
+        # ranks of areas of candidates, candidates with smaller rank than both neighbours
+        candidate = (area <= tolerance) & ~fixed[index]
+        rank = np.empty(len(index), dtype=int)
+        rank[np.argsort(np.where(candidate, area, np.inf), kind='stable')] = np.arange(len(index))
+        remove = candidate & (rank < np.roll(rank, 1)) & (rank < np.roll(rank, -1))
+        # at least 3 vertices per ring (group 0: vertices not in rings)
+        ring = rings[index] + 1
+        count = np.bincount(ring)
+        order = np.argsort(ring, kind='stable')
+        removed = np.zeros(len(index), dtype=int)
+        removed[order] = _cumcount(ring[order], remove[order])
+        remove &= removed <= count[ring] - 3
+        if not remove.any():
+            break
+        keep[index[remove]] = False
+    return keep
+
+
+def _cumcount(groups, flags):
+    """running count of flags within sorted groups"""
+    total = np.cumsum(flags)
+    start = np.searchsorted(groups, groups)     # first index of group
+    return total - np.where(start > 0, total[start - 1], 0)
+
+
+def _distances(points, start, end):
+    """distances of points to edge start-end"""
+    edge = end - start
+    L2 = edge @ edge
+    if L2 == 0:
+        return np.hypot(*(points - start).T)
+    t = np.clip((points - start) @ edge / L2, 0, 1)
+    return np.hypot(*(points - start - t[:,None]*edge).T)
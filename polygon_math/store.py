@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import json
+import os
+
+from polygon_math.polygon import polygon, _polygonBase
+from polygon_math.collection import polygonCollection
+
+# #############################################################################
+# store class
+# #############################################################################
+
+class polygonStore():
+    """
+    binary store of many polygons in a directory, opened as memory maps
+    (fast opening, shared by processes, only accessed data is loaded):
+        - Vertices.f8       vertices of all polygons (float64, 2 columns)
+        - Offsets.i8        Vertices[Offsets[k]:Offsets[k+1]] are the vertices of polygon k
+        - <property>.f8     side columns of properties (one row per polygon)
+        - store.json        numbers of polygons & vertices, axis, columns of properties
+    
+    
+    writing a store:
+    
+    polygonStore.write(directory, Polygons, axis=None)
+    
+        - Polygons: iterable of vertices or polygon objects, or polygonCollection
+        - properties are calculated in batches of polygons
+    
+    
+    opening a store:
+    
+    instance = polygonStore(directory)
+    
+    
+    attributes of polygon store (memory maps, one row per polygon):
+    
+        - Vertices[v,xy], Offsets[k]
+        - Area[k], CenterMass[k,xy], SecondMomentArea[k,:]
+        - solids of revolution: RotationVolume[k], CenterMassCrossSection[k,rz]
+    
+    
+    methods of polygon store:
+    
+        - len(instance)               number of polygons
+        - instance[k]                 polygon object of polygon k, vertices are a view of the
+                                      memory map (no copy), stored properties are not recalculated
+        - collection(start, stop)     polygonCollection of polygons start to stop (no copy)
+    """
+    
+    # names of side columns (of polygonCollection) and number of columns
+    _Columns      = {'_AreaSigned': 1, 'CenterMass': 2, 'SecondMomentArea': 3}
+    _ColumnsSolid = {'_AreaSigned': 1, 'CenterMassCrossSection': 2, 'SecondMomentArea': 3, 'RotationVolume': 1, 'CenterMass': 2, '_Ixy': 1}
+    
+    # -------------------------------------------------------
+    # constructor (memory maps)
+    
+    def __init__(self, directory):
+        with open(os.path.join(directory, 'store.json')) as file:
+            header = json.load(file)
+        self._axis = header['axis']
+        
+        self.Vertices = self._map(directory, 'Vertices', header['vertices'], 2)
+        self.Offsets  = np.memmap(os.path.join(directory, 'Offsets.i8'), dtype='<i8', mode='r')
+        self._columns = {name: self._map(directory, name, header['polygons'], columns)
+                         for name, columns in header['columns'].items()}
+    
+    @staticmethod
+    def _map(directory, name, rows, columns):
+        """read-only memory map of side column"""
+        shape = (rows,) if columns == 1 else (rows, columns)
+        if rows == 0:
+            return np.empty(shape)
+        return np.memmap(os.path.join(directory, name + '.f8'), dtype='<f8', mode='r', shape=shape)
+    
+    # -------------------------------------------------------
+    # properties (side columns)
+    
+    @property
+    def Area(self):
+        return abs(self._columns['_AreaSigned'])
+    
+    def __getattr__(self, name):
+        """side columns of properties"""
+        columns = self.__dict__.get('_columns', {})
+        if name in columns and not name.startswith('_'):
+            return columns[name]
+        raise AttributeError(f"'polygonStore' object has no attribute '{name}'")
+    
+    # -------------------------------------------------------
+    # dunder methods
+    
+    def __repr__(self):
+        return f'polygonStore with {len(self)} polygons'
+    
+    def __len__(self):
+        return len(self.Offsets) - 1
+    
+    def __getitem__(self, k):
+        """polygon object of polygon k with stored properties"""
+        k = range(len(self))[k]
+        P = polygon.fromClosedArray(self.Vertices[self.Offsets[k]:self.Offsets[k+1]], self._axis)
+        for name, column in self._columns.items():
+            if name == 'CenterMass' and self._axis is not None:
+                continue    # list for solids of revolution, calculated from stored properties
+            setattr(P, name, column[k] if column.ndim == 1 else np.array(column[k]))
+        return P
+    
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+    
+    def collection(self, start = 0, stop = None):
+        """polygonCollection of polygons start to stop (vertices are not copied)"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        Offsets = np.array(self.Offsets[start:stop+1])
+        return polygonCollection.fromArrays(self.Vertices[Offsets[0]:Offsets[-1]], Offsets - Offsets[0], self._axis)
+    
+    # -------------------------------------------------------
+    # writing store
+    
+    @staticmethod
+    def write(directory, Polygons, axis = None, batch = 10000):
+        """
+        writes polygons to store
+        Polygons: iterable of vertices or polygon objects, or polygonCollection
+        axis:     optional, solids of revolution, see polygon
+        batch:    number of polygons of which properties are calculated at once
+        """
+        os.makedirs(directory, exist_ok=True)
+        columns = polygonStore._Columns if axis is None else polygonStore._ColumnsSolid
+        
+        files = {name: open(os.path.join(directory, name + '.f8'), 'wb') for name in ['Vertices', *columns]}
+        Offsets = [0]
+        try:
+            vert = []
+            for Vertices in polygonStore._closedVertices(Polygons):
+                vert.append(Vertices)
+                if len(vert) == batch:
+                    polygonStore._writeBatch(files, Offsets, vert, axis)
+                    vert = []
+            if vert:
+                polygonStore._writeBatch(files, Offsets, vert, axis)
+        finally:
+            for file in files.values():
+                file.close()
+        
+        np.array(Offsets, dtype='<i8').tofile(os.path.join(directory, 'Offsets.i8'))
+        header = dict(polygons = len(Offsets)-1, vertices = int(Offsets[-1]), axis = axis, columns = columns)
+        with open(os.path.join(directory, 'store.json'), 'w') as file:
+            json.dump(header, file, indent=2)
+    
+    @staticmethod
+    def _closedVertices(Polygons):
+        """closed vertices of each polygon"""
+        if isinstance(Polygons, polygonCollection):
+            for k in range(len(Polygons)):
+                yield Polygons.Vertices[Polygons.Offsets[k]:Polygons.Offsets[k+1]]
+        else:
+            for Vertices in Polygons:
+                if isinstance(Vertices, _polygonBase):
+                    yield Vertices.Vertices
+                else:
+                    yield polygon._inputChecks(Vertices)
+    
+    @staticmethod
+    def _writeBatch(files, Offsets, vert, axis):
+        """appends vertices and properties of polygons to files"""
+        Offset = np.append(0, np.cumsum([len(Vertices) for Vertices in vert]))
+        Offsets += list(Offsets[-1] + Offset[1:])
+        vert = np.concatenate(vert).astype('<f8')
+        collection = polygonCollection.fromArrays(vert, Offset, axis)
+        vert.tofile(files['Vertices'])
+        for name, file in files.items():
+            if name != 'Vertices':
+                np.asarray(getattr(collection, name), dtype='<f8').tofile(file)
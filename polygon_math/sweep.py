@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# #############################################################################
+# sweep line over edges (sort and sweep of bounding boxes)
+# #############################################################################
+
+# relative tolerance of parameters of intersections and of parallel edges
+_Tolerance = 1e-12
+
+
+def _boxes(P0, P1):
+    """bounding boxes [xmin, ymin, xmax, ymax] of edges P0-P1"""
+    return np.column_stack(( np.minimum(P0, P1), np.maximum(P0, P1) ))
+
+
+def _overlappingPairs(boxes):
+    """pairs of indices (i, j) of overlapping bounding boxes, see _overlappingChunks"""
+    I, J = [np.zeros(0, dtype=int)], [np.zeros(0, dtype=int)]
+    for i, j in _overlappingChunks(boxes):
+        I.append(i)
+        J.append(j)
+    return np.concatenate(I), np.concatenate(J)
+
+
+def _overlappingChunks(boxes, chunksize = 2**20):
+    """
+    generator of chunks of pairs of indices (i, j) of overlapping bounding boxes,
+    the boxes are sorted by their minimum and the sweep line moves along x or y
+    (the axis with fewer overlaps): box j overlaps box i on the sweep axis,
+    if min[i] <= min[j] <= max[i], these pairs are generated in chunks
+    (about chunksize pairs) and filtered by overlap on the other axis
+    
+    time O(n log n + pairs): fine for outlines with short edges (about O(n) pairs),
+    but jagged outlines with many long overlapping edges (e.g. random star) have
+    up to O(n^2) pairs of overlapping boxes (100k vertices: 40M pairs, about 30 s)
+    """
+    n = len(boxes)
+    sweep = {}
+    for axis in (0, 1):
+        order  = np.argsort(boxes[:,axis], kind='stable')
+        ends   = np.searchsorted(boxes[order,axis], boxes[order,axis+2], side='right')
+        counts = np.maximum(ends - np.arange(n) - 1, 0)
+        sweep[axis] = order, counts
+    axis = 0 if sweep[0][1].sum() <= sweep[1][1].sum() else 1
+    order, counts = sweep[axis]
+    other = 1 - axis
+    
+    # boxes after i in order, which start before end of i
+    cumulative = np.cumsum(counts)
+    start = 0
+    while start < n:
+        stop  = max(start + 1, np.searchsorted(cumulative, cumulative[start] - counts[start] + chunksize, side='right'))
+        count = counts[start:stop]
+        first = np.repeat(np.arange(start, stop), count)
+        second = first + 1 + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        i, j = order[first], order[second]
+        overlap = (boxes[i,other] <= boxes[j,other+2]) & (boxes[j,other] <= boxes[i,other+2])
+        yield i[overlap], j[overlap]
+        start = stop
+
+
+def _intersect(P0, P1, Q0, Q1):
+    """
+    intersections of edges P0-P1 and Q0-Q1 (arrays of pairs),
+    returns parameters t, u of intersection P0 + t*(P1-P0) = Q0 + u*(Q1-Q0),
+    Boolean arrays of parallel and collinear edges (t, u not defined)
+    """
+    dP = P1 - P0
+    dQ = Q1 - Q0
+    dPQ = Q0 - P0
+    denom = dP[:,0]*dQ[:,1] - dP[:,1]*dQ[:,0]
+    LP = np.hypot(dP[:,0], dP[:,1])
+    LQ = np.hypot(dQ[:,0], dQ[:,1])
+    
+    parallel  = abs(denom) <= _Tolerance * LP * LQ
+    collinear = parallel & (abs(dPQ[:,0]*dP[:,1] - dPQ[:,1]*dP[:,0]) <= _Tolerance * LP * (LP + np.hypot(dPQ[:,0], dPQ[:,1])))
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (dPQ[:,0]*dQ[:,1] - dPQ[:,1]*dQ[:,0]) / denom
+        u = (dPQ[:,0]*dP[:,1] - dPQ[:,1]*dP[:,0]) / denom
+    return t, u, parallel, collinear
+
+
+def _project(P0, P1, Q):
+    """parameters of points Q projected on edges P0-P1"""
+    dP = P1 - P0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sum((Q - P0)*dP, axis=1) / np.sum(dP**2, axis=1)
+
+# #############################################################################
+# self-intersections
+# #############################################################################
+
+def _selfIntersections(vert):
+    """
+    pairs of indices [i,j] (i < j) of intersecting edges of closed polygon,
+    edges touching only at common vertices (e.g. neighbouring edges) are not counted,
+    edges passed in both directions (connections of rings, see polygon.fromRings)
+    are dropped before testing
+    """
+    P0, P1 = vert[:-1], vert[1:]
+    edges = np.nonzero(~_bothDirections(P0, P1))[0]
+    P0, P1 = P0[edges], P1[edges]
+    pairs = [np.zeros((0,2), dtype=int)]
+    for i, j in _overlappingChunks(_boxes(P0, P1)):
+        intersecting = _edgesIntersecting(P0[i], P1[i], P0[j], P1[j])
+        i, j = edges[i[intersecting]], edges[j[intersecting]]
+        pairs.append(np.column_stack(( np.minimum(i, j), np.maximum(i, j) )))
+    pairs = np.concatenate(pairs)
+    return pairs[np.lexsort(( pairs[:,1], pairs[:,0] ))]
+
+
+def _bothDirections(P0, P1):
+    """Boolean array of edges P0-P1, which are also edges in opposite direction"""
+    # edges sorted by end points in lexicographic order, groups of equal edges
+    forward = (P0[:,0] < P1[:,0]) | (P0[:,0] == P1[:,0]) & (P0[:,1] < P1[:,1])
+    A = np.where(forward[:,None], P0, P1)
+    B = np.where(forward[:,None], P1, P0)
+    order = np.lexsort(( B[:,1], B[:,0], A[:,1], A[:,0] ))
+    A, B = A[order], B[order]
+    new   = np.append(True, np.any(A[1:] != A[:-1], axis=1) | np.any(B[1:] != B[:-1], axis=1))
+    group = np.cumsum(new) - 1
+    
+    # groups with edges in both directions (edges of zero length are not counted)
+    forwards  = np.bincount(group, weights=forward[order])
+    backwards = np.bincount(group, weights=~forward[order] & np.any(A != B, axis=1))
+    both = np.zeros(len(P0), dtype=bool)
+    both[order] = (forwards[group] > 0) & (backwards[group] > 0)
+    return both
+
+
+def _edgesIntersecting(P0, P1, Q0, Q1):
+    """edges P0-P1 and Q0-Q1 intersect, see _selfIntersections"""
+    t, u, parallel, collinear = _intersect(P0, P1, Q0, Q1)
+    eps = _Tolerance
+    
+    # crossing edges, or vertex on other edge
+    with np.errstate(invalid='ignore'):
+        inside   = (t >= -eps) & (t <= 1+eps) & (u >= -eps) & (u <= 1+eps)
+        vertices = ((abs(t) <= eps) | (abs(t-1) <= eps)) & ((abs(u) <= eps) | (abs(u-1) <= eps))
+    crossing = ~parallel & inside & ~vertices
+    
+    # overlapping collinear edges
+    s0 = _project(P0, P1, Q0)
+    s1 = _project(P0, P1, Q1)
+    with np.errstate(invalid='ignore'):
+        overlap = np.minimum(1, np.maximum(s0, s1)) - np.maximum(0, np.minimum(s0, s1)) > eps
+    return crossing | collinear & overlap
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from polygon_math.polygon import polygon
+
+# #############################################################################
+# triangle collection class
+# #############################################################################
+
+class triangleCollection():
+    """
+    geometry calculation of many triangles at once (e.g. elements of FE meshes):
+        - area, centroid (center of mass), inner angles, lengths of edges
+        - incircle and circumscribed (outer) circle
+    
+    The vertices of all triangles are stored in one array of shape (N,3,2),
+    the properties are calculated in one vectorized pass.
+    
+    
+    creating a triangle collection:
+    
+    Vertices = [[[x0,y0],[x1,y1],[x2,y2]], ...]   # vertices of triangles (not closed)
+    instance = triangleCollection(Vertices)
+    
+    instance = triangleCollection.fromMesh(Points, Triangles)
+    
+        - Points[p,xy]:    coordinates of nodes of mesh
+        - Triangles[k,i]:  indices of nodes of triangles, e.g. polygon.Triangles
+    
+    
+    attributes of triangle collection (arrays, one row per triangle):
+    
+        v: Vertex, e: Edge (next of v)
+        - Vertices[k,v,xy]
+        - IsClockwise[k]                  Boolean, order of vertices
+        - Area[k]
+        - Angles[k,v]                     inner angles
+        - EdgesLength[k,e]
+        - CenterMass[k,xy]                centroid / center of mass
+        - CenterOuterCircle[k,xy]         circumcenter / center of circumsribed (outer) circle
+        - RadiusOuterCircle[k]            radius of circumsribed (outer) circle
+        - CenterInnerCircle[k,xy]         center of incircle (inner circle)
+        - RadiusInnerCircle[k]            radius of incircle (inner circle)
+    
+    
+    methods of triangle collection:
+    
+        - len(instance)                   number of triangles
+        - instance[k]                     polygon object of triangle k
+    """
+    
+    # -------------------------------------------------------
+    # constructors
+    
+    def __init__(self, Vertices):
+        vert = np.asarray(Vertices, dtype=float)
+        if vert.ndim != 3 or vert.shape[1:] != (3, 2):
+            raise ValueError(f'vertices of triangles need shape (N,3,2), not {vert.shape}')
+        self._setup(vert)
+    
+    @classmethod
+    def fromMesh(cls, Points, Triangles):
+        """collection of triangles Points[Triangles[k]] of mesh"""
+        return cls(np.asarray(Points, dtype=float)[np.asarray(Triangles)])
+    
+    def _setup(self, vert):
+        """calculates geometrical properties of triangles"""
+        self.Vertices = vert
+        
+        AreaSigned, self.EdgesLength, self.Angles = self._geom(vert)
+        self.IsClockwise = AreaSigned < 0
+        self.Area        = abs(AreaSigned)
+        self.CenterMass  = vert.mean(axis=1)
+        self.CenterOuterCircle, self.RadiusOuterCircle = self._outerCircles(vert)
+        self.CenterInnerCircle, self.RadiusInnerCircle = self._incircles(vert, self.Area, self.EdgesLength)
+    
+    # -------------------------------------------------------
+    # geometrical properties of triangles
+    
+    @staticmethod
+    def _edges(vert):
+        """edge vectors a->b, b->c, c->a of triangles"""
+        return np.roll(vert, -1, axis=1) - vert
+    
+    @staticmethod
+    def _geom(vert):
+        """signed areas, lengths of edges and inner angles / ° of triangles"""
+        edges = triangleCollection._edges(vert)
+        EdgesLength = np.hypot(edges[...,0], edges[...,1])
+        
+        # cross & dot product of edges at each vertex (previous edge reversed)
+        previous = np.roll(edges, 1, axis=1)
+        cross = edges[...,1]*previous[...,0] - edges[...,0]*previous[...,1]
+        dot   = -np.sum(edges*previous, axis=2)
+        
+        AreaSigned = cross[:,0]/2
+        Angles = np.degrees(np.arctan2(abs(cross), dot))
+        return AreaSigned, EdgesLength, Angles
+    
+    @staticmethod
+    def _outerCircles(vert):
+        """
+        centers & radii of circumscribed (outer) circles
+        https://en.wikipedia.org/wiki/Circumscribed_circle
+        """
+        B = vert[:,1] - vert[:,0]       # coordinate transformation
+        C = vert[:,2] - vert[:,0]
+        D = 2*(B[:,0]*C[:,1] - B[:,1]*C[:,0])
+        LB = np.sum(B**2, axis=1)
+        LC = np.sum(C**2, axis=1)
+        U = np.column_stack(( C[:,1]*LB - B[:,1]*LC, B[:,0]*LC - C[:,0]*LB )) / D[:,None]
+        return U + vert[:,0], np.hypot(U[:,0], U[:,1])
+    
+    @staticmethod
+    def _incircles(vert, Area, EdgesLength):
+        """
+        centers & radii of incircles (inner circles)
+        https://en.wikipedia.org/wiki/Incenter
+        """
+        Perimeter = EdgesLength.sum(axis=1)
+        weights   = np.roll(EdgesLength, -1, axis=1)    # lengths of opposite edges
+        Center    = np.einsum('kv,kvx->kx', weights, vert) / Perimeter[:,None]
+        return Center, 2*Area / Perimeter
+    
+    # -------------------------------------------------------
+    # dunder methods
+    
+    def __repr__(self):
+        return f'triangleCollection with {len(self)} triangles'
+    
+    def __len__(self):
+        return len(self.Vertices)
+    
+    def __getitem__(self, k):
+        """polygon object of triangle k"""
+        vert = self.Vertices[k]
+        return polygon.fromClosedArray(np.vstack((vert, vert[:1])))
+    
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# #############################################################################
+# triangulation by ear clipping
+# #############################################################################
+
+def earcut(vert):
+    """
+    triangulation of polygon by ear clipping,
+    vert: closed polygon (first = last vertex), holes connected to outer contour
+    returns indices of vertices of triangles [[i0,i1,i2],...]
+
+    The polygon is split into rings at repeated vertices (e.g. connections to holes),
+    rings with the order of vertices of the polygon are outer contours, the others
+    holes of the smallest outer contour containing them. Each outer contour is
+    connected to its holes by bridges to the leftmost vertices of the holes.
+    The vertices are a circular doubly linked list, for larger polygons
+    ears are only checked against vertices with close z-order (Morton code).
+    If no ear is found, degenerated vertices are removed, local
+    self-intersections are cured and finally the polygon is split.
+    adapted from https://github.com/mapbox/earcut
+    """
+    vert = np.asarray(vert, dtype=float)
+    triangles = []
+    
+    # outer contours (counter-clockwise) and their holes (clockwise)
+    rings = _rings(vert)
+    areas = [_signedArea(vert[ring]) for ring in rings]
+    orientation = np.sign(sum(areas))
+    outers = sorted((ring for ring, area in zip(rings, areas) if np.sign(area) == orientation),
+                    key=lambda ring: abs(_signedArea(vert[ring])))
+    holes  = {id(ring): [] for ring in outers}
+    for ring, area in zip(rings, areas):
+        if np.sign(area) == -orientation:
+            for outer in outers:
+                if _contains(vert[outer], vert[ring[0]]):
+                    holes[id(outer)].append(ring)
+                    break
+    
+    coordinates = vert.tolist()     # python floats are faster in scalar arithmetic
+    for outer in outers:
+        outerNode = _linkedList(coordinates, outer, True)
+        if outerNode is None or outerNode.next is outerNode.prev:
+            continue
+        if holes[id(outer)]:
+            outerNode = _eliminateHoles(coordinates, holes[id(outer)], outerNode)
+        
+        # z-order hashing for larger polygons
+        indices = np.concatenate([outer] + holes[id(outer)])
+        minX, minY = vert[indices].min(axis=0).tolist()
+        size = np.ptp(vert[indices], axis=0).max()
+        invSize = 32767 / float(size) if len(indices) > 80 and size > 0 else 0
+        
+        _earcutLinked(outerNode, triangles, minX, minY, invSize, 0)
+    return np.array(triangles, dtype=int).reshape(-1, 3)
+
+
+def _rings(vert):
+    """
+    indices of vertices of rings, the polygon is split at repeated vertices,
+    rings without area (e.g. edges passed in both directions) are dropped
+    """
+    rings = []
+    stack = []      # indices of vertices of current path
+    position = {}   # position of vertex on stack
+    for i, vertex in enumerate(map(tuple, vert[:-1])):
+        if vertex in position:
+            start = position[vertex]
+            ring  = stack[start:]
+            for j in ring[1:]:
+                del position[tuple(vert[j])]
+            del stack[start+1:]
+            if len(ring) > 2:
+                rings.append(ring)
+        else:
+            position[vertex] = len(stack)
+            stack.append(i)
+    if len(stack) > 2:
+        rings.append(stack)
+    return [ring for ring in rings if _signedArea(vert[ring]) != 0]
+
+# #############################################################################
+# linked list of vertices
+# #############################################################################
+
+class _node():
+    __slots__ = ('i', 'x', 'y', 'prev', 'next', 'z', 'prevZ', 'nextZ')
+
+    def __init__(self, i, x, y):
+        self.i = i          # index of vertex
+        self.x = x
+        self.y = y
+        self.prev  = None   # previous & next vertex in polygon
+        self.next  = None
+        self.z     = 0      # z-order
+        self.prevZ = None   # previous & next vertex in z-order
+        self.nextZ = None
+
+
+def _linkedList(coordinates, ring, counterClockwise):
+    """circular doubly linked list of vertices of ring in given order"""
+    if (_signedArea(np.array([coordinates[i] for i in ring])) > 0) != counterClockwise:
+        ring = ring[::-1]
+    last = None
+    for i in ring:
+        last = _insertNode(i, *coordinates[i], last)
+    if last is not None and _equals(last, last.next):
+        _removeNode(last)
+        last = last.next
+    return last
+
+
+def _insertNode(i, x, y, last):
+    p = _node(i, x, y)
+    if last is None:
+        p.prev = p
+        p.next = p
+    else:
+        p.next = last.next
+        p.prev = last
+        last.next.prev = p
+        last.next = p
+    return p
+
+
+def _removeNode(p):
+    p.next.prev = p.prev
+    p.prev.next = p.next
+    if p.prevZ is not None:
+        p.prevZ.nextZ = p.nextZ
+    if p.nextZ is not None:
+        p.nextZ.prevZ = p.prevZ
+
+
+def _splitPolygon(a, b):
+    """splits polygon by diagonal a-b into two, returns vertex of second polygon"""
+    a2 = _node(a.i, a.x, a.y)
+    b2 = _node(b.i, b.x, b.y)
+    an = a.next
+    bp = b.prev
+    a.next = b
+    b.prev = a
+    a2.next = an
+    an.prev = a2
+    b2.next = a2
+    a2.prev = b2
+    bp.next = b2
+    b2.prev = bp
+    return b2
+
+
+def _filterPoints(start, end = None):
+    """removes duplicated and collinear vertices"""
+    if start is None:
+        return start
+    if end is None:
+        end = start
+    p = start
+    while True:
+        again = False
+        if _equals(p, p.next) or _area(p.prev, p, p.next) == 0:
+            _removeNode(p)
+            p = end = p.prev
+            if p is p.next:
+                break
+            again = True
+        else:
+            p = p.next
+        if not again and p is end:
+            break
+    return end
+
+# #############################################################################
+# ear clipping
+# #############################################################################
+
+def _earcutLinked(ear, triangles, minX, minY, invSize, stage):
+    """
+    clips ears in passes along the ring (the vertex after a clipped ear is tested in
+    the next pass, as in mapbox/earcut), the next pass only tests the neighbours of
+    clipped ears, the other vertices are only tested again in a full pass, if no ear
+    is found among them (vertices inside of their triangles may have been clipped)
+    """
+    if ear is None:
+        return
+    if stage == 0 and invSize:
+        _indexCurve(ear, minX, minY, invSize)
+
+    candidates = _ringNodes(ear)
+    full = True
+    while ear.prev is not ear.next:
+        changed = []
+        skip = None
+        for node in candidates:
+            if node is skip or node.prev.next is not node or ear.prev is ear.next:
+                continue    # after clipped ear, removed or polygon done
+            ear = node
+            prev = node.prev
+            next = node.next
+            if _isEarHashed(node, minX, minY, invSize) if invSize else _isEar(node):
+                triangles.append((prev.i, node.i, next.i))
+                _removeNode(node)
+                changed += [prev, next]
+                skip = next
+                ear = next
+
+        if not changed:
+            if not full:
+                candidates = _ringNodes(ear)
+                full = True
+                continue
+            # no ear found in full loop
+            if stage == 0:      # remove degenerated vertices
+                _earcutLinked(_filterPoints(ear), triangles, minX, minY, invSize, 1)
+            elif stage == 1:    # cure local self-intersections
+                ear = _cureLocalIntersections(_filterPoints(ear), triangles)
+                _earcutLinked(ear, triangles, minX, minY, invSize, 2)
+            elif stage == 2:    # split polygon
+                _splitEarcut(ear, triangles, minX, minY, invSize)
+            break
+        candidates = dict.fromkeys(changed)     # without duplicates, in order
+        full = False
+
+
+def _ringNodes(start):
+    """vertices of ring in order"""
+    nodes = [start]
+    p = start.next
+    while p is not start:
+        nodes.append(p)
+        p = p.next
+    return nodes
+
+
+def _isEar(ear):
+    """no other vertex inside of triangle (convex vertex)"""
+    a, b, c = ear.prev, ear, ear.next
+    if _area(a, b, c) >= 0:
+        return False    # reflex vertex
+    x0, x1 = min(a.x, b.x, c.x), max(a.x, b.x, c.x)
+    y0, y1 = min(a.y, b.y, c.y), max(a.y, b.y, c.y)
+    p = c.next
+    while p is not a:
+        if (x0 <= p.x <= x1 and y0 <= p.y <= y1 and
+                _pointInTriangle(a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y) and _area(p.prev, p, p.next) >= 0):
+            return False
+        p = p.next
+    return True
+
+
+def _isEarHashed(ear, minX, minY, invSize):
+    """as _isEar, only vertices with z-order in range of bounding box of triangle"""
+    a, b, c = ear.prev, ear, ear.next
+    if _area(a, b, c) >= 0:
+        return False    # reflex vertex
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
+    x0, x1 = min(ax, bx, cx), max(ax, bx, cx)
+    y0, y1 = min(ay, by, cy), max(ay, by, cy)
+    minZ = _zOrder(x0, y0, minX, minY, invSize)
+    maxZ = _zOrder(x1, y1, minX, minY, invSize)
+    
+    # vertices in both directions of z-order (inlined test of _isEar)
+    p = ear.prevZ
+    n = ear.nextZ
+    while p is not None and p.z >= minZ:
+        if (x0 <= p.x <= x1 and y0 <= p.y <= y1 and p is not a and p is not c and
+                _pointInTriangle(ax, ay, bx, by, cx, cy, p.x, p.y) and _area(p.prev, p, p.next) >= 0):
+            return False
+        p = p.prevZ
+    while n is not None and n.z <= maxZ:
+        if (x0 <= n.x <= x1 and y0 <= n.y <= y1 and n is not a and n is not c and
+                _pointInTriangle(ax, ay, bx, by, cx, cy, n.x, n.y) and _area(n.prev, n, n.next) >= 0):
+            return False
+        n = n.nextZ
+    return True
+
+
+def _cureLocalIntersections(start, triangles):
+    """clips triangles of local self-intersections a-p, p.next-b"""
+    p = start
+    while True:
+        a = p.prev
+        b = p.next.next
+        if not _equals(a, b) and _intersects(a, p, p.next, b) and _locallyInside(a, b) and _locallyInside(b, a):
+            triangles.append((a.i, p.i, b.i))
+            _removeNode(p)
+            _removeNode(p.next)
+            p = start = b
+        p = p.next
+        if p is start:
+            break
+    return _filterPoints(p)
+
+
+def _splitEarcut(start, triangles, minX, minY, invSize):
+    """splits polygon by valid diagonal and triangulates both parts"""
+    a = start
+    while True:
+        b = a.next.next
+        while b is not a.prev:
+            if a.i != b.i and _isValidDiagonal(a, b):
+                c = _splitPolygon(a, b)
+                a = _filterPoints(a, a.next)
+                c = _filterPoints(c, c.next)
+                _earcutLinked(a, triangles, minX, minY, invSize, 0)
+                _earcutLinked(c, triangles, minX, minY, invSize, 0)
+                return
+            b = b.next
+        a = a.next
+        if a is start:
+            return
+
+# #############################################################################
+# holes
+# #############################################################################
+
+def _eliminateHoles(coordinates, holes, outerNode):
+    """connects holes to outer contour, from left to right"""
+    queue = []
+    for ring in holes:
+        node = _linkedList(coordinates, ring, False)
+        if node is not None:
+            queue.append(_leftmost(node))
+    queue.sort(key=lambda node: (node.x, node.y))
+    for hole in queue:
+        bridge = _findHoleBridge(hole, outerNode)
+        if bridge is not None:
+            bridgeReverse = _splitPolygon(bridge, hole)
+            _filterPoints(bridgeReverse, bridgeReverse.next)
+            outerNode = _filterPoints(bridge, bridge.next)
+    return outerNode
+
+
+def _findHoleBridge(hole, outerNode):
+    """
+    vertex of outer contour visible from leftmost vertex of hole (David Eberly),
+    ray to the left from the hole hits edge, the bridge goes to the endpoint of the edge
+    or to the reflex vertex inside of the triangle with the smallest angle to the ray
+    """
+    hx, hy = hole.x, hole.y
+    qx = -np.inf
+    m  = None
+    p  = outerNode
+    while True:
+        if p.y >= hy >= p.next.y and p.next.y != p.y:
+            x = p.x + (hy - p.y) * (p.next.x - p.x) / (p.next.y - p.y)
+            if qx < x <= hx:
+                qx = x
+                m  = p if p.x < p.next.x else p.next
+                if x == hx:
+                    return m    # hole touches outer contour
+        p = p.next
+        if p is outerNode:
+            break
+    if m is None:
+        return None
+    
+    stop   = m
+    mx, my = m.x, m.y
+    tanMin = np.inf
+    p = m
+    while True:
+        if (hx >= p.x >= mx and hx != p.x and
+                _pointInTriangle(hx if hy < my else qx, hy, mx, my, qx if hy < my else hx, hy, p.x, p.y)):
+            tan = abs(hy - p.y) / (hx - p.x)
+            if _locallyInside(p, hole) and (tan < tanMin or (tan == tanMin and (p.x > m.x or
+                    (p.x == m.x and _area(m.prev, m, p.prev) < 0 and _area(p.next, m, m.next) < 0)))):
+                m = p
+                tanMin = tan
+        p = p.next
+        if p is stop:
+            return m
+
+
+def _leftmost(start):
+    p = leftmost = start
+    while True:
+        if p.x < leftmost.x or (p.x == leftmost.x and p.y < leftmost.y):
+            leftmost = p
+        p = p.next
+        if p is start:
+            return leftmost
+
+# #############################################################################
+# z-order (Morton code)
+# #############################################################################
+
+def _indexCurve(start, minX, minY, invSize):
+    """z-order of vertices and linked list sorted by z-order"""
+    nodes = []
+    p = start
+    while True:
+        if p.z == 0:
+            p.z = _zOrder(p.x, p.y, minX, minY, invSize)
+        nodes.append(p)
+        p = p.next
+        if p is start:
+            break
+    nodes.sort(key=lambda node: node.z)
+    for prev, next in zip(nodes[:-1], nodes[1:]):
+        prev.nextZ = next
+        next.prevZ = prev
+    nodes[0].prevZ  = None
+    nodes[-1].nextZ = None
+
+
+def _zOrder(x, y, minX, minY, invSize):
+    """interleaved bits of 15 bit integer coordinates"""
+    x = int((x - minX) * invSize)
+    y = int((y - minY) * invSize)
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    y = (y | (y << 8)) & 0x00FF00FF
+    y = (y | (y << 4)) & 0x0F0F0F0F
+    y = (y | (y << 2)) & 0x33333333
+    y = (y | (y << 1)) & 0x55555555
+    return x | (y << 1)
+
+# #############################################################################
+# geometric predicates
+# #############################################################################
+
+def _signedArea(vert):
+    """area of ring (not closed), positive for counter-clockwise order of vertices, see polygon"""
+    from polygon_math.polygon import _polygonBase     # polygon module imports triangulation
+    return _polygonBase._area(np.vstack(( vert, vert[:1] )))
+
+
+def _contains(vert, point):
+    """point inside of ring (not closed), crossing number"""
+    x, y   = vert[:,0], vert[:,1]
+    xn, yn = np.roll(x, -1), np.roll(y, -1)
+    crosses = (y > point[1]) != (yn > point[1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xc = x + (point[1] - y) * (xn - x) / (yn - y)
+    return np.count_nonzero(crosses & (point[0] < xc)) % 2 == 1
+
+
+def _area(p, q, r):
+    """negative for convex vertex q (counter-clockwise)"""
+    return (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
+
+
+def _equals(p1, p2):
+    return p1.x == p2.x and p1.y == p2.y
+
+
+def _pointInTriangle(ax, ay, bx, by, cx, cy, px, py):
+    """point inside of triangle (counter-clockwise) or on its edges"""
+    return ((cx - px) * (ay - py) >= (ax - px) * (cy - py) and
+            (ax - px) * (by - py) >= (bx - px) * (ay - py) and
+            (bx - px) * (cy - py) >= (cx - px) * (by - py))
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+def _onSegment(p, q, r):
+    """q on segment p-r, if collinear"""
+    return min(p.x, r.x) <= q.x <= max(p.x, r.x) and min(p.y, r.y) <= q.y <= max(p.y, r.y)
+
+
+def _intersects(p1, q1, p2, q2):
+    """segments p1-q1 and p2-q2 intersect"""
+    o1 = _sign(_area(p1, q1, p2))
+    o2 = _sign(_area(p1, q1, q2))
+    o3 = _sign(_area(p2, q2, p1))
+    o4 = _sign(_area(p2, q2, q1))
+    if o1 != o2 and o3 != o4:
+        return True
+    return ((o1 == 0 and _onSegment(p1, p2, q1)) or (o2 == 0 and _onSegment(p1, q2, q1)) or
+            (o3 == 0 and _onSegment(p2, p1, q2)) or (o4 == 0 and _onSegment(p2, q1, q2)))
+
+
+def _intersectsPolygon(a, b):
+    """diagonal a-b intersects any edge of polygon"""
+    p = a
+    while True:
+        if (p.i != a.i and p.next.i != a.i and p.i != b.i and p.next.i != b.i and
+                _intersects(p, p.next, a, b)):
+            return True
+        p = p.next
+        if p is a:
+            return False
+
+
+def _locallyInside(a, b):
+    """diagonal a-b is locally inside of polygon at a"""
+    if _area(a.prev, a, a.next) < 0:
+        return _area(a, b, a.next) >= 0 and _area(a, a.prev, b) >= 0
+    return _area(a, b, a.prev) < 0 or _area(a, a.next, b) < 0
+
+
+def _middleInside(a, b):
+    """middle of diagonal a-b is inside of polygon (crossing test)"""
+    p = a
+    inside = False
+    px = (a.x + b.x) / 2
+    py = (a.y + b.y) / 2
+    while True:
+        if ((p.y > py) != (p.next.y > py) and p.next.y != p.y and
+                px < (p.next.x - p.x) * (py - p.y) / (p.next.y - p.y) + p.x):
+            inside = not inside
+        p = p.next
+        if p is a:
+            return inside
+
+
+def _isValidDiagonal(a, b):
+    """diagonal a-b connects vertices inside of polygon without intersections"""
+    return (a.next.i != b.i and a.prev.i != b.i and not _intersectsPolygon(a, b) and
+            (_locallyInside(a, b) and _locallyInside(b, a) and _middleInside(a, b) and
+             (_area(a.prev, a, b.prev) != 0 or _area(a, b.prev, b) != 0) or
+             _equals(a, b) and _area(a.prev, a, a.next) > 0 and _area(b.prev, b, b.next) > 0))
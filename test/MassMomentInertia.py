@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:02:47 2026
+
+mass moments of inertia of solids of revolution (density 1) compared to closed forms,
+polar about axis of rotation, transverse about axis through center of mass
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+import sys
+sys.path.insert(0,'..')
+from polygon_math import polygon
+
+# -----------------------------------------------------------------------------
+# examples
+
+R  = 2      # outer radius
+Ri = 1      # inner radius of tube
+H  = 3      # height
+
+# cross-section [r,z], mass m, analytic [polar, transverse]
+m_cylinder = np.pi*R**2*H
+m_tube     = np.pi*(R**2 - Ri**2)*H
+m_cone     = np.pi*R**2*H/3
+examples = {
+    'cylinder': ( [[0,0],[R,0],[R,H],[0,H]],
+                  [m_cylinder*R**2/2, m_cylinder*(3*R**2 + H**2)/12] ),
+    'tube':     ( [[Ri,0],[R,0],[R,H],[Ri,H]],
+                  [m_tube*(R**2 + Ri**2)/2, m_tube*(3*(R**2 + Ri**2) + H**2)/12] ),
+    'cone':     ( [[0,0],[R,0],[0,H]],
+                  [3*m_cone*R**2/10, m_cone*(3*R**2/20 + 3*H**2/80)] ),
+    }
+
+# -----------------------------------------------------------------------------
+# manipulation
+
+dz = 5      # shift along axis of rotation (no influence)
+
+# -----------------------------------------------------------------------------
+# comparison results
+
+solids = {}
+for name, (Vertices, I_analytic) in examples.items():
+    print(name, '   expected', I_analytic)
+    for axis in (0, 1):
+        vert = np.add(Vertices, [0, dz])
+        solid = polygon(vert[:, ::-1] if axis == 0 else vert, axis=axis)
+        solids[name, axis] = solid
+        print(f'    axis {axis}:', solid.MassMomentInertia)
+
+# -----------------------------------------------------------------------------
+# plot
+
+plt.close('all')
+
+fig = plt.figure(figsize=(12, 4))
+for k, name in enumerate(examples):
+    ax = fig.add_subplot(1, len(examples), k+1, projection='3d')
+    solids[name, 1].plot3d(ax=ax)
+    ax.set_title(name)
+plt.tight_layout()
+plt.show()
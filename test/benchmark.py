@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:12:40 2026
+
+benchmark of construction, geometrical properties, point testing, manipulation and self-intersections
+
+    python benchmark.py            compare with saved baseline (regressions are reported)
+    python benchmark.py --save     save results as baseline
+    python benchmark.py --quick    only small polygons and query batches
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+import numpy as np
+
+import sys
+sys.path.insert(0,'..')
+from polygon_math import polygon
+from polygon_math.polygon import _polygonBase
+
+# -----------------------------------------------------------------------------
+# settings
+
+BASELINE  = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+TOLERANCE = 1.5         # factor of time compared to baseline reported as regression
+
+NVERTICES = [3, 100, 10**4, 10**6]
+NQUERIES  = [1, 10**3, 10**5]
+MAXPAIRS  = 10**9       # maximum number of point-edge combinations for point testing without index
+MAXJAGGED = 10**4       # maximum number of vertices of jagged star for selfIntersections (O(n^2) box pairs)
+
+# -----------------------------------------------------------------------------
+# test data
+
+def vertices(N):
+    """star-shaped polygon with N vertices"""
+    rng = np.random.default_rng(N)
+    angle  = np.linspace(0, 2*np.pi, N, endpoint=False)
+    radius = 1 + 0.3*rng.random(N)
+    return np.column_stack(( radius*np.cos(angle), radius*np.sin(angle) ))
+
+def smooth(N):
+    """circle with N vertices"""
+    angle = np.linspace(0, 2*np.pi, N, endpoint=False)
+    return np.column_stack(( np.cos(angle), np.sin(angle) ))
+
+def points(N):
+    rng = np.random.default_rng(N)
+    return rng.random((N,2))*3 - 1.5
+
+# -----------------------------------------------------------------------------
+# benchmark cases
+
+def cases(Nvertices, Nqueries):
+    """name, function to time"""
+    for N in Nvertices:
+        vert   = vertices(N)
+        closed = np.vstack(( vert, vert[:1] ))
+        P = polygon(vert)
+        yield f'construction polygon() N={N}',        lambda: polygon(vert)
+        yield f'construction fromClosedArray N={N}',  lambda: polygon.fromClosedArray(closed)
+        yield f'Area N={N}',                          lambda: _polygonBase._area(closed)
+        yield f'CenterMass N={N}',                    lambda: _polygonBase._edgeMoments(closed[:-1], closed[1:])[1]
+        yield f'SecondMomentArea N={N}',              lambda: _polygonBase._secondMoment(*_polygonBase._edgeMoments(closed[:-1], closed[1:])[2:], False)
+        yield f'EdgesLength N={N}',                   lambda: _polygonBase._edgesLength(closed)
+        yield f'Angles N={N}',                        lambda: _polygonBase._angles(closed)
+        yield f'move N={N}',                          lambda: P.move([1,2])
+        yield f'rotate N={N}',                        lambda: P.rotate(30, [0,0])
+        yield f'scale N={N}',                         lambda: P.scale([2,1], [0,0])
+        yield f'transform pipeline N={N}',            lambda: ((P.transform() - [1,1]).rotate(30, [0,0]) * [2,1] + [1,1]).apply()
+        C = polygon(smooth(N))
+        yield f'selfIntersections smooth N={N}',      lambda: C.selfIntersections()
+        if N <= MAXJAGGED:
+            yield f'selfIntersections jagged N={N}',  lambda: P.selfIntersections()
+        for Q in Nqueries:
+            pts = points(Q)
+            if N*Q <= MAXPAIRS:
+                yield f'isPointInside N={N} Q={Q}',   lambda: _polygonBase._isPointInside(closed, pts)
+                yield f'isPointOnEdge N={N} Q={Q}',   lambda: _polygonBase._isPointOnEdge(closed, pts)
+            if N > _polygonBase._IndexMinEdges:
+                P._Index = None
+                P._Queries = np.inf     # index is built on first query
+                P.isPointInside(pts[:1])
+                yield f'isPointInside index N={N} Q={Q}', lambda: P.isPointInside(pts)
+                yield f'isPointOnEdge index N={N} Q={Q}', lambda: P.isPointOnEdge(pts)
+
+def measure(function, repeat = 5):
+    """best time of one call / s"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+# -----------------------------------------------------------------------------
+# run
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save',  action='store_true', help='save results as baseline')
+    parser.add_argument('--quick', action='store_true', help='only small polygons and query batches')
+    args = parser.parse_args()
+
+    Nvertices, Nqueries = NVERTICES, NQUERIES
+    if args.quick:
+        Nvertices, Nqueries = NVERTICES[:2], NQUERIES[:2]
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as file:
+            baseline = json.load(file)
+
+    results     = {}
+    regressions = []
+    for name, function in cases(Nvertices, Nqueries):
+        results[name] = measure(function)
+        line = f'{name:50s} {results[name]*1e6:14.1f} µs'
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            line += f'   {ratio:6.2f} x baseline'
+            if ratio > TOLERANCE:
+                line += '   REGRESSION'
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        baseline.update(results)
+        with open(BASELINE, 'w') as file:
+            json.dump(baseline, file, indent=2)
+        print(f'baseline saved: {BASELINE}')
+
+    if regressions:
+        print(f'{len(regressions)} regressions slower than {TOLERANCE} x baseline')
+        sys.exit(1)
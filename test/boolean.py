@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:20:41 2026
+
+union, intersection and difference of squares compared to analytic area and center of mass
+"""
+
+import matplotlib.pyplot as plt
+
+import sys
+sys.path.insert(0,'..')
+from polygon_math import polygon
+
+# -----------------------------------------------------------------------------
+# examples
+
+def square(x, y, a):
+    """square with lower left corner [x,y] and side length a"""
+    return polygon([[x,y],[x+a,y],[x+a,y+a],[x,y+a]])
+
+def composite(*parts):
+    """area and center of mass of rectangles (x, y, width, height, sign)"""
+    A  = sum(s*w*h for x, y, w, h, s in parts)
+    Sx = sum(s*w*h*(x+w/2) for x, y, w, h, s in parts) / A
+    Sy = sum(s*w*h*(y+h/2) for x, y, w, h, s in parts) / A
+    return A, [Sx, Sy]
+
+A = square(0, 0, 2)
+
+# B and analytic results [union, intersection, difference] (None: empty)
+examples = {
+    'overlapping':  ( square(1, 1, 2),
+                      [ composite((0,0,2,2,1), (1,1,2,2,1), (1,1,1,1,-1)),
+                        composite((1,1,1,1,1)),
+                        composite((0,0,2,2,1), (1,1,1,1,-1)) ] ),
+    'nested':       ( square(.5, .5, 1),
+                      [ composite((0,0,2,2,1)),
+                        composite((.5,.5,1,1,1)),
+                        composite((0,0,2,2,1), (.5,.5,1,1,-1)) ] ),
+    'disjoint':     ( square(3, 0, 1),
+                      [ composite((0,0,2,2,1), (3,0,1,1,1)),
+                        None,
+                        composite((0,0,2,2,1)) ] ),
+    'edge-sharing': ( square(2, 0, 2),
+                      [ composite((0,0,4,2,1)),
+                        None,
+                        composite((0,0,2,2,1)) ] ),
+    'part of edge': ( square(2, 1, 2),
+                      [ composite((0,0,2,2,1), (2,1,2,2,1)),
+                        None,
+                        composite((0,0,2,2,1)) ] ),
+    }
+
+# -----------------------------------------------------------------------------
+# comparison results
+
+results = {}
+for name, (B, expected) in examples.items():
+    print(name)
+    for operation, analytic in zip(('union', 'intersection', 'difference'), expected):
+        R = getattr(A, operation)(B)
+        results[name, operation] = R
+        computed = None if R is None else (float(R.Area), R.CenterMass.tolist())
+        print(f'    {operation:13}', computed, '   expected', analytic)
+
+# -----------------------------------------------------------------------------
+# plot
+
+plt.close('all')
+
+fig, axes = plt.subplots(len(examples), 3, figsize=(9, 3*len(examples)))
+for row, (name, (B, expected)) in zip(axes, examples.items()):
+    for ax, operation in zip(row, ('union', 'intersection', 'difference')):
+        plt.sca(ax)
+        A.plot('k:')
+        B.plot('k:')
+        R = results[name, operation]
+        if R is not None:
+            R.plot('b')
+            R.plotCenterMass('rx')
+        ax.set_title(f'{name}: {operation}', fontsize=9)
+        ax.axis('equal')
+plt.tight_layout()
+plt.show()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:48:03 2026
+
+in-place editing of vertices (moveVertex, insertVertex, deleteVertex) compared to
+a new polygon of the edited vertices (all properties calculated from scratch)
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+import sys
+sys.path.insert(0,'..')
+from polygon_math import polygon
+
+# -----------------------------------------------------------------------------
+# examples
+
+names = ('Area', 'CenterMass', 'SecondMomentArea', 'EdgesLength', 'EdgesMiddle', 'Angles',
+         'RotationVolume', 'CenterMassCrossSection', 'MassMomentInertia')
+
+# sequence of edits of L-shape, revolution around y-axis
+edits = [
+    ('moveVertex',   (2, [1.5, 4])),
+    ('insertVertex', (3, [3, 2])),
+    ('insertVertex', (0, [.5, -1])),
+    ('deleteVertex', (5,)),
+    ('moveVertex',   (-1, [5.5, -.5])),
+    ('insertVertex', (7, [3, -1.5])),   # after last vertex
+    ('deleteVertex', (0,)),
+    ]
+
+P = polygon([[1,0],[1,4],[2,4],[2,1],[5,1],[5,0]], axis=1)
+for name in names:
+    getattr(P, name)        # cached properties are updated by the edits
+original = polygon(P.Vertices, axis=1)
+
+# -----------------------------------------------------------------------------
+# comparison results
+
+for method, args in edits:
+    getattr(P, method)(*args)
+    Q = polygon(P.Vertices, axis=1)
+    error = max(np.max(abs(np.subtract(getattr(P, name), getattr(Q, name)))) for name in names)
+    print(f'{method:13} {str(args):17} vertices: {len(P.Vertices)-1:2}   '
+          f'Area: {P.Area:7.4f}   maximum difference of properties: {error:.2e}')
+
+# vertices dragged onto a line (area zero) and back, the centroid is
+# derived from the updated first moment of area
+S = polygon([[0,0],[2,0],[2,2],[0,2]])
+S.CenterMass
+with np.errstate(divide='ignore', invalid='ignore'):
+    for i, point in [(2, [1,0]), (3, [.5,0]), (2, [2,2]), (3, [0,2])]:
+        S.moveVertex(i, point)
+        print(f'moveVertex    {str((i, point)):17} Area: {S.Area:7.4f}   CenterMass: {S.CenterMass}')
+print('expected CenterMass', polygon(S.Vertices).CenterMass)
+
+# -----------------------------------------------------------------------------
+# plot
+
+plt.close('all')
+
+plt.figure()
+original.plot('k:', label='original')
+P.plot(numbers=True, label='edited')
+P.plotCenterMass(label='center of mass')
+plt.legend()
+plt.axis('equal')
+plt.show()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:05:12 2026
+
+self-intersections of polygons with holes (connections of rings are no intersections)
+"""
+
+import matplotlib.pyplot as plt
+
+import sys
+sys.path.insert(0,'..')
+from polygon_math import polygon
+
+# -----------------------------------------------------------------------------
+# examples
+
+outer = [[0,0],[10,0],[10,10],[0,10]]
+
+# two holes, the connections of the rings cross the other hole
+P = polygon.fromRings([outer, [[2,2],[2,4],[4,4],[4,2]], [[6,6],[6,8],[8,8],[8,6]]])
+print('two holes:             ', P.selfIntersections().tolist(), '   expected []')
+
+# three holes
+Q = polygon.fromRings([outer, [[2,2],[2,4],[4,4],[4,2]], [[6,6],[6,8],[8,8],[8,6]], [[6,1],[6,3],[8,3],[8,1]]])
+print('three holes:           ', Q.selfIntersections().tolist(), '   expected []')
+
+# overlapping holes, two pairs of crossing edges of the holes
+R = polygon.fromRings([outer, [[2,2],[2,6],[6,6],[6,2]], [[4,4],[4,8],[8,8],[8,4]]])
+edges = R.selfIntersections()
+print('overlapping holes:     ', edges.tolist(), '   expected 2 pairs')
+print('first pair of edges:   ', [R.Vertices[e:e+2].tolist() for e in edges[0]])
+
+# bow tie
+S = polygon([[0,0],[2,2],[2,0],[0,2]])
+print('bow tie:               ', S.selfIntersections().tolist(), '   expected [[0, 2]]')
+
+# -----------------------------------------------------------------------------
+# plot
+
+plt.close('all')
+
+plt.figure()
+R.plot(numbers=True, label='overlapping holes')
+plt.legend()
+plt.axis('equal')
+plt.show()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:31:26 2026
+
+triangulation by ear clipping (Triangles), sum of areas of triangles compared to
+analytic area of polygon, number of triangles compared to n-2 (n vertices of rings)
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+import sys
+sys.path.insert(0,'..')
+from polygon_math import polygon
+
+# -----------------------------------------------------------------------------
+# examples
+
+# star with N tips (vertices at radii R and r), area N*R*r*sin(pi/N)
+N, R, r = 7, 2, .8
+phi = np.arange(2*N) * np.pi/N
+star = np.column_stack(( np.cos(phi), np.sin(phi) )) * np.where(np.arange(2*N) % 2, r, R)[:,None]
+starArea = N*R*r*np.sin(np.pi/N)
+
+# comb with N teeth (width 1, gap 1, length L) on base of height 1
+N, L = 6, 3
+comb = [[0,0],[2*N-1,0]]
+for k in range(N-1, -1, -1):
+    comb += [[2*k+1,1],[2*k+1,1+L],[2*k,1+L],[2*k,1]]
+
+examples = {
+    # name: (polygon, analytic area, number of vertices of rings)
+    'square':           ( polygon([[0,0],[2,0],[2,2],[0,2]]), 4, 4 ),
+    'L-shape':          ( polygon([[0,0],[0,4],[1,4],[1,1],[3,1],[3,0]]), 6, 6 ),
+    'star':             ( polygon(star), starArea, len(star) ),
+    'comb':             ( polygon(comb), 2*N-1 + N*L, len(comb) ),
+    'square with hole': ( polygon.fromRings([[[0,0],[4,0],[4,4],[0,4]], [[1,1],[1,3],[3,3],[3,1]]]), 12, 8 ),
+    'two holes':        ( polygon.fromRings([[[0,0],[10,0],[10,10],[0,10]],
+                                             [[2,2],[2,4],[4,4],[4,2]], [[6,6],[6,8],[8,8],[8,6]]]), 92, 12 ),
+    }
+
+# -----------------------------------------------------------------------------
+# comparison results
+
+for name, (P, area, n) in examples.items():
+    t = P.Vertices[P.Triangles]
+    areas = abs( (t[:,1,0]-t[:,0,0])*(t[:,2,1]-t[:,0,1]) - (t[:,2,0]-t[:,0,0])*(t[:,1,1]-t[:,0,1]) )/2
+    connections = len(P.Vertices) - 1 - n     # repeated vertices of connections of rings
+    print(f'{name:17} sum of triangles: {np.sum(areas):8.4f}   expected {area:8.4f}   '
+          f'triangles: {len(P.Triangles):2}   expected {n - 2 + connections}')
+
+# -----------------------------------------------------------------------------
+# plot
+
+plt.close('all')
+
+fig, axes = plt.subplots(2, 3, figsize=(12, 8))
+for ax, (name, (P, area, n)) in zip(axes.ravel(), examples.items()):
+    ax.triplot(P.Vertices[:,0], P.Vertices[:,1], P.Triangles, color='b', lw=.5)
+    P.plot('k', ax=ax)
+    ax.set_title(name)
+    ax.axis('equal')
+plt.tight_layout()
+plt.show()